@@ -5,8 +5,13 @@ Handles content summarization via REST API.
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
+from contextlib import asynccontextmanager
+from functools import lru_cache
+import json
 import sys
 import os
 
@@ -14,14 +19,38 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from config import current_config as config
-from services import YouTubeService, WebsiteService, SummarizationService
-from utils import URLValidator, APIKeyValidator
+from services import (
+    YouTubeService,
+    WebsiteService,
+    SummarizationService,
+    get_whisper_device,
+    resolve_whisper_model,
+    warm_token_encoding,
+)
+from batch_scheduler import transcription_scheduler
+from langchain_core.documents import Document
+from utils import URLValidator, APIKeyValidator, summary_stats
 from exceptions import AppException
 from logger import setup_logging
 
 logger = setup_logging(__name__)
 
-app = FastAPI(title="Content Summarizer API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start loading the tokenizer off the event loop on startup, and close the
+    website HTTP client kept alive between requests on shutdown.
+    """
+    warm_token_encoding()
+    yield
+    await WebsiteService.close_async_client()
+
+
+app = FastAPI(
+    title="Content Summarizer API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 # Enable CORS
 app.add_middleware(
@@ -33,13 +62,31 @@ app.add_middleware(
 )
 
 
+
+class SkipStreamGZipMiddleware(GZipMiddleware):
+    """GZip middleware that leaves Server-Sent Event streams uncompressed."""
+
+    async def __call__(self, scope, receive, send):
+        # Compressing an event stream buffers chunks inside zlib and delays them
+        if scope["type"] == "http" and scope["path"].endswith("/stream"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress larger JSON bodies (summaries, config)
+app.add_middleware(SkipStreamGZipMiddleware, minimum_size=500, compresslevel=5)
+
+
 class SummarizeRequest(BaseModel):
     """Request model for summarization."""
     url: str
     api_key: str
     style: str = "balanced"
     length: int = 300
-    whisper_model: str = "base"
+    whisper_model: str = config.DEFAULT_WHISPER_MODEL
+    # None detects the spoken language
+    language: Optional[str] = None
 
 
 class SummarizeResponse(BaseModel):
@@ -51,12 +98,81 @@ class SummarizeResponse(BaseModel):
     status: str = "success"
 
 
+@lru_cache(maxsize=32)
+def _get_service(api_key: str) -> SummarizationService:
+    """Get a summarization service, reusing its LLM client per API key."""
+    return SummarizationService(api_key)
+
+
 @app.get("/health")
 async def health():
     """Health check endpoint."""
     return {"status": "ok", "service": "content-summarizer"}
 
 
+def _validate_request(request: SummarizeRequest) -> str:
+    """
+    Validate a summarization request.
+
+    Args:
+        request: SummarizeRequest to validate
+
+    Returns:
+        URL type ('youtube' or 'website')
+
+    Raises:
+        HTTPException: If the request is invalid
+    """
+    if not request.url.strip():
+        raise HTTPException(status_code=400, detail="URL is required")
+
+    if not request.api_key.strip():
+        raise HTTPException(status_code=400, detail="API key is required")
+
+    url_type = URLValidator.get_url_type(request.url)
+    if not url_type:
+        raise HTTPException(status_code=400, detail="Invalid URL format")
+
+    if not APIKeyValidator.validate_groq_key(request.api_key):
+        raise HTTPException(status_code=400, detail="Invalid API key format")
+
+    if (
+        request.whisper_model not in config.WHISPER_MODELS
+        and request.whisper_model not in config.ENGLISH_WHISPER_MODELS
+    ):
+        raise HTTPException(status_code=400, detail="Unsupported Whisper model")
+
+    return url_type
+
+
+async def _load_documents(request: SummarizeRequest, url_type: str) -> list:
+    """
+    Load the documents to summarize for a request.
+
+    Args:
+        request: Validated SummarizeRequest
+        url_type: URL type ('youtube' or 'website')
+
+    Returns:
+        List of Document objects
+    """
+    if url_type == "youtube":
+        logger.info("Downloading and transcribing YouTube video...")
+        whisper_model = resolve_whisper_model(request.whisper_model, request.language)
+        if get_whisper_device() == "cuda":
+            transcript = await transcription_scheduler.submit(
+                request.url, whisper_model, request.language
+            )
+        else:
+            transcript = await YouTubeService.get_transcript_async(
+                request.url, whisper_model, request.language
+            )
+        return [Document(page_content=transcript)]
+
+    logger.info("Loading website content...")
+    return await WebsiteService.load_and_extract_async(request.url)
+
+
 @app.post("/summarize", response_model=SummarizeResponse)
 async def summarize(request: SummarizeRequest):
     """
@@ -69,52 +185,21 @@ async def summarize(request: SummarizeRequest):
         SummarizeResponse with summary and metadata
     """
     try:
-        # Validate inputs
-        if not request.url.strip():
-            raise HTTPException(status_code=400, detail="URL is required")
-        
-        if not request.api_key.strip():
-            raise HTTPException(status_code=400, detail="API key is required")
-        
-        if not URLValidator.is_valid_url(request.url):
-            raise HTTPException(status_code=400, detail="Invalid URL format")
-        
-        if not APIKeyValidator.validate_groq_key(request.api_key):
-            raise HTTPException(status_code=400, detail="Invalid API key format")
-        
-        url_type = URLValidator.get_url_type(request.url)
-        if not url_type:
-            raise HTTPException(status_code=400, detail="Unsupported URL type")
-        
+        url_type = _validate_request(request)
         logger.info(f"Processing {url_type} URL: {request.url[:50]}")
         
         # Initialize service
-        service = SummarizationService(request.api_key)
-        
-        # Process based on URL type
-        if url_type == "youtube":
-            logger.info("Downloading and transcribing YouTube video...")
-            transcript = YouTubeService.download_and_transcribe(
-                request.url, 
-                request.whisper_model
-            )
-            from langchain_core.documents import Document
-            docs = [Document(page_content=transcript)]
-        else:
-            logger.info("Loading website content...")
-            docs = WebsiteService.load_and_extract(request.url)
+        service = _get_service(request.api_key)
+        docs = await _load_documents(request, url_type)
         
         # Generate summary
         logger.info(f"Generating {request.style} summary...")
-        summary = service.summarize(
-            docs,
-            style=request.style,
-            length=request.length
+        summary = await service.summarize_async(
+            docs, style=request.style, length=request.length
         )
         
         # Calculate metrics
-        word_count = len(summary.split())
-        reading_time = max(1, word_count // 200)
+        word_count, reading_time = summary_stats(summary)
         
         logger.info(f"Successfully summarized: {word_count} words")
         
@@ -136,6 +221,61 @@ async def summarize(request: SummarizeRequest):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@app.post("/summarize/stream")
+async def summarize_stream(request: SummarizeRequest):
+    """
+    Summarize content from URL, streaming the summary as Server-Sent Events.
+
+    Each event carries a JSON-encoded text chunk. A final 'done' event
+    carries url_type, word_count and reading_time; failures mid-stream
+    emit an 'error' event.
+
+    Args:
+        request: SummarizeRequest with URL, API key, and options
+
+    Returns:
+        StreamingResponse with media type text/event-stream
+    """
+    try:
+        url_type = _validate_request(request)
+        logger.info(f"Streaming {url_type} URL: {request.url[:50]}")
+
+        service = _get_service(request.api_key)
+        docs = await _load_documents(request, url_type)
+
+    except HTTPException:
+        raise
+    except AppException as e:
+        logger.error(f"Application error: {e.error_code} - {e.message}")
+        raise HTTPException(status_code=422, detail=e.message)
+    except Exception as e:
+        logger.exception(f"Unexpected error: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    async def event_stream():
+        parts = []
+        try:
+            async for chunk in service.summarize_stream_async(
+                docs, style=request.style, length=request.length
+            ):
+                parts.append(chunk)
+                yield f"data: {json.dumps(chunk)}\n\n"
+        except AppException as e:
+            logger.error(f"Application error: {e.error_code} - {e.message}")
+            yield f"event: error\ndata: {json.dumps(e.message)}\n\n"
+            return
+
+        word_count, reading_time = summary_stats("".join(parts).strip())
+        stats = {
+            "url_type": url_type,
+            "word_count": word_count,
+            "reading_time": reading_time,
+        }
+        yield f"event: done\ndata: {json.dumps(stats)}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.get("/styles")
 async def get_styles():
     """Get available summary styles."""
@@ -150,6 +290,7 @@ async def get_config():
         "min_summary_length": config.MIN_SUMMARY_LENGTH,
         "default_summary_length": config.DEFAULT_SUMMARY_LENGTH,
         "whisper_models": config.WHISPER_MODELS,
+        "english_whisper_models": config.ENGLISH_WHISPER_MODELS,
         "summary_styles": config.SUMMARY_STYLES,
     }
 
@@ -157,4 +298,14 @@ async def get_config():
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Multiple workers need the app as an import string; uvicorn[standard]
+    # picks uvloop and httptools automatically.
+    if config.WEB_CONCURRENCY > 1:
+        # Worker processes inherit this and stop rotating the shared log file
+        os.environ["LOG_EXTERNAL_ROTATION"] = "true"
+    uvicorn.run(
+        "api.summarize:app",
+        host="0.0.0.0",
+        port=port,
+        workers=config.WEB_CONCURRENCY,
+    )
@@ -3,8 +3,12 @@ Main Streamlit application for YT Web Summarizer.
 Production-ready with advanced features, error handling, and caching.
 """
 
+import asyncio
+import os
+import time
+from collections import deque
+from itertools import islice
 import streamlit as st
-import torch
 from datetime import datetime
 from typing import Optional
 
@@ -19,15 +23,19 @@ from utils import (
     URLValidator,
     APIKeyValidator,
     SimpleCache,
+    DiskCache,
     RateLimiter,
     sanitize_text,
     format_timestamp,
-    estimate_reading_time,
+    summary_stats,
 )
 from services import (
     YouTubeService,
     WebsiteService,
     SummarizationService,
+    get_whisper_device,
+    resolve_whisper_model,
+    warm_token_encoding,
 )
 from langchain_core.documents import Document
 
@@ -35,15 +43,154 @@ logger = setup_logging(__name__)
 
 # Initialize session state
 if "cache" not in st.session_state:
-    st.session_state.cache = SimpleCache(ttl_seconds=config.CACHE_TTL_SECONDS)
+    st.session_state.cache = SimpleCache(
+        ttl_seconds=config.CACHE_TTL_SECONDS, maxsize=config.MAX_CACHE_ENTRIES
+    )
 if "rate_limiter" not in st.session_state:
     st.session_state.rate_limiter = RateLimiter(
         config.RATE_LIMIT_CALLS, config.RATE_LIMIT_PERIOD_SECONDS
     )
 if "history" not in st.session_state:
-    st.session_state.history = [] if config.ENABLE_HISTORY else None
-if "summarization_service" not in st.session_state:
-    st.session_state.summarization_service = None
+    st.session_state.history = (
+        deque(maxlen=config.MAX_HISTORY_ENTRIES) if config.ENABLE_HISTORY else None
+    )
+
+
+# Page styles, collapsed to a single line once at import
+_CSS = " ".join(
+    """
+<style>
+/* Main gradient background */
+.stApp {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+}
+
+/* Content container with glass effect */
+.main .block-container {
+    background: rgba(255, 255, 255, 0.95);
+    padding: 2rem;
+    border-radius: 20px;
+    box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.37);
+    backdrop-filter: blur(4px);
+    border: 1px solid rgba(255, 255, 255, 0.18);
+}
+
+/* Sidebar styling */
+section[data-testid="stSidebar"] {
+    background: linear-gradient(180deg, #667eea 0%, #764ba2 100%);
+}
+
+section[data-testid="stSidebar"] > div {
+    background: rgba(255, 255, 255, 0.1);
+    backdrop-filter: blur(10px);
+}
+
+/* Sidebar text color */
+section[data-testid="stSidebar"] * {
+    color: white !important;
+}
+
+/* Input fields */
+.stTextInput > div > div > input {
+    border-radius: 10px;
+    border: 2px solid #667eea;
+    padding: 12px;
+    font-size: 16px;
+}
+
+/* Buttons */
+.stButton > button {
+    width: 100%;
+    border-radius: 10px;
+    padding: 12px 24px;
+    font-weight: 600;
+    font-size: 16px;
+    transition: all 0.3s ease;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    border: none;
+}
+
+.stButton > button:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
+}
+
+/* Primary button */
+.stButton > button[kind="primary"] {
+    background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+}
+
+/* Metrics */
+div[data-testid="stMetricValue"] {
+    font-size: 28px;
+    font-weight: 700;
+    color: #667eea;
+}
+
+/* Headers */
+h1 {
+    color: #2d3748;
+    font-weight: 800;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    background-clip: text;
+}
+
+h2, h3 {
+    color: #2d3748;
+    font-weight: 700;
+}
+
+/* Success/Error messages */
+.stSuccess, .stError, .stInfo, .stWarning {
+    border-radius: 10px;
+    padding: 1rem;
+    margin: 0.5rem 0;
+}
+
+/* Expander */
+.streamlit-expanderHeader {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    border-radius: 10px;
+    color: white;
+    font-weight: 600;
+}
+
+/* Download button */
+.stDownloadButton > button {
+    background: linear-gradient(135deg, #48c6ef 0%, #6f86d6 100%);
+}
+
+/* Summary text container */
+.summary-container {
+    background: #f7fafc;
+    border-left: 4px solid #667eea;
+    padding: 1.5rem;
+    border-radius: 10px;
+    margin: 1rem 0;
+    line-height: 1.8;
+}
+</style>
+""".split()
+)
+
+
+@st.cache_resource
+def get_summary_cache() -> DiskCache:
+    """Get the on-disk summary cache shared across sessions and restarts."""
+    return DiskCache(
+        os.path.join(config.CACHE_DIR, "summaries"),
+        ttl_seconds=config.CACHE_TTL_SECONDS,
+        max_bytes=config.MAX_CACHE_SIZE_MB * 1024 * 1024,
+    )
+
+
+@st.cache_resource(max_entries=32)
+def get_summarization_service(api_key: str) -> SummarizationService:
+    """Get a summarization service shared across reruns and sessions."""
+    return SummarizationService(api_key)
 
 
 def configure_page():
@@ -54,125 +201,9 @@ def configure_page():
         layout="wide",
         initial_sidebar_state="expanded",
     )
-    st.markdown(
-        """
-        <style>
-        /* Main gradient background */
-        .stApp {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        }
-        
-        /* Content container with glass effect */
-        .main .block-container {
-            background: rgba(255, 255, 255, 0.95);
-            padding: 2rem;
-            border-radius: 20px;
-            box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.37);
-            backdrop-filter: blur(4px);
-            border: 1px solid rgba(255, 255, 255, 0.18);
-        }
-        
-        /* Sidebar styling */
-        section[data-testid="stSidebar"] {
-            background: linear-gradient(180deg, #667eea 0%, #764ba2 100%);
-        }
-        
-        section[data-testid="stSidebar"] > div {
-            background: rgba(255, 255, 255, 0.1);
-            backdrop-filter: blur(10px);
-        }
-        
-        /* Sidebar text color */
-        section[data-testid="stSidebar"] * {
-            color: white !important;
-        }
-        
-        /* Input fields */
-        .stTextInput > div > div > input {
-            border-radius: 10px;
-            border: 2px solid #667eea;
-            padding: 12px;
-            font-size: 16px;
-        }
-        
-        /* Buttons */
-        .stButton > button {
-            width: 100%;
-            border-radius: 10px;
-            padding: 12px 24px;
-            font-weight: 600;
-            font-size: 16px;
-            transition: all 0.3s ease;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border: none;
-        }
-        
-        .stButton > button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-        }
-        
-        /* Primary button */
-        .stButton > button[kind="primary"] {
-            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        }
-        
-        /* Metrics */
-        div[data-testid="stMetricValue"] {
-            font-size: 28px;
-            font-weight: 700;
-            color: #667eea;
-        }
-        
-        /* Headers */
-        h1 {
-            color: #2d3748;
-            font-weight: 800;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-        
-        h2, h3 {
-            color: #2d3748;
-            font-weight: 700;
-        }
-        
-        /* Success/Error messages */
-        .stSuccess, .stError, .stInfo, .stWarning {
-            border-radius: 10px;
-            padding: 1rem;
-            margin: 0.5rem 0;
-        }
-        
-        /* Expander */
-        .streamlit-expanderHeader {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            border-radius: 10px;
-            color: white;
-            font-weight: 600;
-        }
-        
-        /* Download button */
-        .stDownloadButton > button {
-            background: linear-gradient(135deg, #48c6ef 0%, #6f86d6 100%);
-        }
-        
-        /* Summary text container */
-        .summary-container {
-            background: #f7fafc;
-            border-left: 4px solid #667eea;
-            padding: 1.5rem;
-            border-radius: 10px;
-            margin: 1rem 0;
-            line-height: 1.8;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    # Streamlit drops elements that are not re-emitted, so the style block
+    # is written on every rerun
+    st.markdown(_CSS, unsafe_allow_html=True)
 
 
 def render_header():
@@ -195,7 +226,7 @@ def render_header():
     # Device info in corner
     col1, col2, col3 = st.columns([1, 6, 1])
     with col3:
-        device_info = "🚀 GPU" if torch.cuda.is_available() else "💻 CPU"
+        device_info = "🚀 GPU" if get_whisper_device() == "cuda" else "💻 CPU"
         st.metric("Device", device_info)
 
 
@@ -211,13 +242,8 @@ def render_sidebar():
             help="Get your API key from https://console.groq.com/",
         )
 
-        # Whisper Model
-        whisper_model = st.selectbox(
-            "🎙️ Whisper Model (YouTube)",
-            config.WHISPER_MODELS,
-            index=config.WHISPER_MODELS.index(config.DEFAULT_WHISPER_MODEL),
-            help="Larger models are more accurate but slower",
-        )
+        # Whisper Model (rendered here, filled once the language is known)
+        whisper_container = st.container()
 
         # Summarization Options
         st.markdown("---")
@@ -242,9 +268,35 @@ def render_sidebar():
         if config.ENABLE_ADVANCED_OPTIONS:
             st.markdown("---")
             st.subheader("🔬 Advanced Options")
-            language = st.selectbox("Content Language", config.SUPPORTED_LANGUAGES)
+            language = st.selectbox(
+                "Content Language",
+                ["auto"] + config.SUPPORTED_LANGUAGES,
+                index=0,
+                help="'auto' detects the spoken language",
+            )
         else:
             language = config.DEFAULT_LANGUAGE
+        if language == "auto":
+            language = None
+
+        # English content gets the faster English-only Whisper models; sizes
+        # without one (large) stay selectable
+        if language == "english":
+            whisper_models = config.ENGLISH_WHISPER_MODELS + [
+                model
+                for model in config.WHISPER_MODELS
+                if f"{model}.en" not in config.ENGLISH_WHISPER_MODELS
+            ]
+        else:
+            whisper_models = config.WHISPER_MODELS
+        default_model = resolve_whisper_model(config.DEFAULT_WHISPER_MODEL, language)
+        with whisper_container:
+            whisper_model = st.selectbox(
+                "🎙️ Whisper Model (YouTube)",
+                whisper_models,
+                index=whisper_models.index(default_model),
+                help="Larger models are more accurate but slower",
+            )
 
         return {
             "api_key": api_key,
@@ -255,7 +307,9 @@ def render_sidebar():
         }
 
 
-def validate_inputs(config_dict: dict, url: str) -> tuple[bool, Optional[str]]:
+def validate_inputs(
+    config_dict: dict, url: str
+) -> tuple[bool, Optional[str], Optional[str]]:
     """
     Validate user inputs.
 
@@ -264,33 +318,31 @@ def validate_inputs(config_dict: dict, url: str) -> tuple[bool, Optional[str]]:
         url: URL to validate
 
     Returns:
-        Tuple of (is_valid, error_message)
+        Tuple of (is_valid, error_message, url_type)
     """
     # Validate API key
     if not config_dict["api_key"].strip():
-        return False, "⚠️ Please provide your Groq API key in the sidebar."
+        return False, "⚠️ Please provide your Groq API key in the sidebar.", None
 
     if not APIKeyValidator.validate_groq_key(config_dict["api_key"]):
-        return False, "❌ Invalid Groq API key format."
+        return False, "❌ Invalid Groq API key format.", None
 
     # Validate URL
     if not url.strip():
-        return False, "❌ Please provide a URL."
-
-    if not URLValidator.is_valid_url(url):
-        return False, "❌ Please enter a valid URL."
+        return False, "❌ Please provide a URL.", None
 
     url_type = URLValidator.get_url_type(url)
     if not url_type:
-        return False, "❌ Unsupported URL. Please enter a YouTube or website URL."
+        return False, "❌ Please enter a valid URL.", None
 
-    return True, None
+    return True, None, url_type
 
 
 def add_to_history(entry: dict) -> None:
     """Add entry to history."""
     if config.ENABLE_HISTORY and st.session_state.history is not None:
-        entry["timestamp"] = datetime.now()
+        # Raw nanoseconds; only rendered rows are formatted
+        entry["timestamp"] = time.time_ns()
         st.session_state.history.append(entry)
         logger.info(f"Added to history: {entry['url'][:50]}")
 
@@ -299,7 +351,8 @@ def render_history():
     """Render summarization history."""
     if config.ENABLE_HISTORY and st.session_state.history:
         with st.expander("📚 History", expanded=False):
-            for i, entry in enumerate(reversed(st.session_state.history)):
+            recent = islice(reversed(st.session_state.history), config.HISTORY_DISPLAY_LIMIT)
+            for i, entry in enumerate(recent):
                 col1, col2, col3 = st.columns([0.5, 0.3, 0.2])
                 with col1:
                     st.caption(entry["url"][:40] + "...")
@@ -310,9 +363,39 @@ def render_history():
                         st.session_state.selected_history = i
 
 
+async def run_pipeline(config_dict: dict, url: str, url_type: str) -> list:
+    """
+    Fetch the content to summarize.
+
+    Website pages are fetched with the async HTTP client, which is closed
+    before returning because every run gets a fresh event loop. For YouTube,
+    the audio download and the Whisper model load are overlapped.
+
+    Args:
+        config_dict: Configuration dictionary from sidebar
+        url: URL to process
+        url_type: URL type ('youtube' or 'website')
+
+    Returns:
+        List of Document objects
+    """
+    if url_type == "youtube":
+        transcript = await YouTubeService.get_transcript_async(
+            url, config_dict["whisper_model"], config_dict["language"]
+        )
+        return [Document(page_content=transcript)]
+
+    try:
+        return await WebsiteService.load_and_extract_async(url)
+    finally:
+        await WebsiteService.close_async_client()
+
+
 def main():
     """Main application logic."""
     configure_page()
+    # Runs once per process, in a background thread
+    warm_token_encoding()
     render_header()
 
     # Sidebar
@@ -343,7 +426,7 @@ def main():
         "✨ Summarize Content", use_container_width=True, type="primary"
     ):
         # Validate inputs
-        is_valid, error_msg = validate_inputs(config_dict, url)
+        is_valid, error_msg, url_type = validate_inputs(config_dict, url)
         if not is_valid:
             st.error(error_msg)
             st.stop()
@@ -361,54 +444,58 @@ def main():
                 st.error(f"⏱️ {e.message}")
                 st.stop()
 
-        # Check cache
-        cache_key = f"{url}_{config_dict['summary_style']}_{config_dict['summary_length']}"
+        # Check cache (YouTube summaries are keyed by video, not URL spelling)
+        video_id = URLValidator.get_youtube_video_id(url)
+        if video_id:
+            cache_key = (
+                f"{video_id}_{config_dict['whisper_model']}_{config_dict['language']}_"
+                f"{config_dict['summary_style']}_{config_dict['summary_length']}"
+            )
+        else:
+            cache_key = f"{url}_{config_dict['summary_style']}_{config_dict['summary_length']}"
+        # Session cache first, then the persistent cache shared by all sessions
         cached_result = st.session_state.cache.get(cache_key)
+        if cached_result is None and config.ENABLE_CACHE:
+            cached_result = get_summary_cache().get(cache_key)
+            if cached_result is not None:
+                st.session_state.cache.set(cache_key, cached_result)
 
         try:
             with st.spinner("⏳ Processing..."):
                 # Device info
-                device_type = "GPU" if torch.cuda.is_available() else "CPU"
+                device_type = "GPU" if get_whisper_device() == "cuda" else "CPU"
                 st.info(f"🖥️ Using device: {device_type}")
 
                 if cached_result:
                     st.success("✅ Loaded from cache (recent summary)")
                     summary = cached_result
                 else:
-                    # Initialize summarization service
-                    if (
-                        st.session_state.summarization_service is None
-                        or st.session_state.summarization_service.api_key
-                        != config_dict["api_key"]
-                    ):
-                        st.session_state.summarization_service = SummarizationService(
-                            config_dict["api_key"]
-                        )
-
-                    service = st.session_state.summarization_service
-                    url_type = URLValidator.get_url_type(url)
+                    service = get_summarization_service(config_dict["api_key"])
 
                     # Process based on URL type
                     if url_type == "youtube":
                         st.info("📺 Downloading and transcribing YouTube video...")
-                        transcript = YouTubeService.download_and_transcribe(
-                            url, config_dict["whisper_model"]
-                        )
-                        docs = [Document(page_content=transcript)]
                     else:
                         st.info("🌐 Loading website content...")
-                        docs = WebsiteService.load_and_extract(url)
+                    docs = asyncio.run(run_pipeline(config_dict, url, url_type))
 
                     # Summarize
                     st.info("🤖 Generating summary...")
-                    summary = service.summarize(
-                        docs,
-                        style=config_dict["summary_style"],
-                        length=config_dict["summary_length"],
-                    )
+                    stream_placeholder = st.empty()
+                    with stream_placeholder.container():
+                        summary = st.write_stream(
+                            service.summarize_stream(
+                                docs,
+                                style=config_dict["summary_style"],
+                                length=config_dict["summary_length"],
+                            )
+                        ).strip()
+                    stream_placeholder.empty()
 
                     # Cache result
                     st.session_state.cache.set(cache_key, summary)
+                    if config.ENABLE_CACHE:
+                        get_summary_cache().set(cache_key, summary)
 
                 # Display results
                 st.success("✅ Summary Generated")
@@ -422,8 +509,7 @@ def main():
 
                 with result_col2:
                     st.markdown("### 📊 Statistics")
-                    word_count = len(summary.split())
-                    reading_time = estimate_reading_time(summary)
+                    word_count, reading_time = summary_stats(summary)
                     st.metric("Words", word_count)
                     st.metric("Reading Time", f"{reading_time} min")
                     st.metric("URL Type", url_type.capitalize())
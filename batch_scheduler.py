@@ -0,0 +1,101 @@
+"""
+Transcription scheduler for YouTube videos on GPU.
+Each request downloads as soon as it arrives and transcribes as soon as a
+GPU is free, with at most one transcription per configured GPU.
+"""
+
+import asyncio
+from typing import Dict, Optional, Set, Tuple
+
+from logger import setup_logging
+from services import YouTubeService
+from config import current_config as config
+
+logger = setup_logging(__name__)
+
+# (url, whisper_model_size, language)
+JobKey = Tuple[str, str, Optional[str]]
+
+
+class TranscriptionScheduler:
+    """Limit concurrent transcriptions to one per GPU and share duplicate jobs."""
+
+    def __init__(self, gpu_count: int = 1):
+        """
+        Initialize scheduler.
+
+        Args:
+            gpu_count: Number of transcriptions allowed to run at once
+        """
+        self.gpu_count = gpu_count
+        # asyncio primitives are bound to the loop they are first used on
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._gpu_slots: Optional[asyncio.Semaphore] = None
+        self._jobs: Set[asyncio.Task] = set()
+        self._pending: Dict[JobKey, asyncio.Future] = {}
+
+    async def submit(
+        self, url: str, whisper_model_size: str = "base", language: Optional[str] = None
+    ) -> str:
+        """
+        Transcribe a video and wait for the transcript.
+
+        Identical requests that are still in progress share one job.
+
+        Args:
+            url: YouTube URL
+            whisper_model_size: Whisper model size
+            language: Content language (e.g. 'english'); None detects it
+
+        Returns:
+            Transcribed text
+        """
+        transcript = YouTubeService.load_cached_transcript(
+            url, whisper_model_size, language
+        )
+        if transcript is not None:
+            return transcript
+
+        key = (url, whisper_model_size, language)
+        future = self._pending.get(key)
+        if future is None:
+            self._bind_loop()
+            future = self._loop.create_future()
+            self._pending[key] = future
+            task = asyncio.create_task(self._run_job(key, future))
+            self._jobs.add(task)
+            task.add_done_callback(self._jobs.discard)
+        return await asyncio.shield(future)
+
+    def _bind_loop(self) -> None:
+        """Create the GPU semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._gpu_slots = asyncio.Semaphore(self.gpu_count)
+            self._pending = {}
+
+    async def _run_job(self, key: JobKey, future: asyncio.Future) -> None:
+        """Download, wait for a free GPU, transcribe and resolve the future."""
+        url, whisper_model_size, language = key
+        try:
+            audio = await asyncio.to_thread(YouTubeService.load_audio, url)
+            async with self._gpu_slots:
+                transcript = await asyncio.to_thread(
+                    YouTubeService.transcribe_audio, audio, whisper_model_size, language
+                )
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            YouTubeService.save_transcript(
+                url, whisper_model_size, transcript, language
+            )
+            future.set_result(transcript)
+        finally:
+            # Kept until now so duplicates submitted meanwhile share this job
+            self._pending.pop(key, None)
+
+
+transcription_scheduler = TranscriptionScheduler(
+    gpu_count=len(config.WHISPER_DEVICE_INDEX)
+)
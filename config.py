@@ -21,9 +21,29 @@ class Config:
     GROQ_TIMEOUT = int(os.getenv("GROQ_TIMEOUT", "30"))
 
     # Whisper Configuration
-    WHISPER_MODELS = ["base", "small", "medium", "large"]
+    # Encoder cost grows with model size (tiny 39M, base 74M, small 244M,
+    # medium 769M, large 1.55B params); base is the best speed/accuracy default.
+    WHISPER_MODELS = ["tiny", "base", "small", "medium", "large"]
+    # English-only variants: same cost as the multilingual model of the same
+    # size but more accurate on English, so a smaller one is usually enough.
+    ENGLISH_WHISPER_MODELS = ["tiny.en", "base.en", "small.en", "medium.en"]
     DEFAULT_WHISPER_MODEL = "base"
     WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "auto")  # 'cuda', 'cpu', or 'auto'
+    # CTranslate2 compute type: 'auto' picks int8_float16 on CUDA and int8 on CPU.
+    # Use 'float16' for slightly better accuracy on GPUs with spare memory.
+    WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "auto")
+    # GPUs Whisper runs on, e.g. '0,1'; each holds a model replica and
+    # concurrent transcriptions are spread across them
+    WHISPER_DEVICE_INDEX = [
+        int(index) for index in os.getenv("WHISPER_DEVICE_INDEX", "0").split(",")
+    ]
+    # Windows decoded per encoder call; lower it if the GPU runs out of memory,
+    # 1 disables batched transcription
+    WHISPER_BATCH_SIZE = int(os.getenv("WHISPER_BATCH_SIZE", "16"))
+    # Greedy decoding is several times faster than beam search for a small
+    # accuracy cost; VAD skips silent stretches before they reach the model.
+    WHISPER_BEAM_SIZE = int(os.getenv("WHISPER_BEAM_SIZE", "1"))
+    WHISPER_VAD_FILTER = os.getenv("WHISPER_VAD_FILTER", "true").lower() == "true"
 
     # Summarization Configuration
     DEFAULT_SUMMARY_LENGTH = 300
@@ -31,26 +51,63 @@ class Config:
     MAX_SUMMARY_LENGTH = 1000
     SUMMARY_STYLES = ["balanced", "bullet_points", "executive", "technical", "simplified"]
     DEFAULT_SUMMARY_STYLE = "balanced"
+    MAX_CONCURRENT_CHUNKS = int(os.getenv("MAX_CONCURRENT_CHUNKS", "4"))
+    # Longer content is split into chunks that are summarized concurrently
+    # (map step) before the styled summary is written (combine step).
+    MAX_SINGLE_PROMPT_CHARS = int(os.getenv("MAX_SINGLE_PROMPT_CHARS", "12000"))
+    CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "3000"))
+    CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "150"))
 
     # Content Processing
-    MAX_WEBSITE_CONTENT_LENGTH = 4000
+    # Measured in cl100k_base tokens so non-English pages are not over-long
+    MAX_WEBSITE_CONTENT_TOKENS = int(os.getenv("MAX_WEBSITE_CONTENT_TOKENS", "1000"))
+    # Seconds to wait for the tokenizer's first download before truncating by
+    # characters instead
+    TOKENIZER_LOAD_TIMEOUT = float(os.getenv("TOKENIZER_LOAD_TIMEOUT", "5"))
+    # Only the start of a page is downloaded; the kept text comes from there
+    MAX_WEBSITE_HTML_BYTES = int(os.getenv("MAX_WEBSITE_HTML_BYTES", str(256 * 1024)))
+    WEBSITE_TIMEOUT = int(os.getenv("WEBSITE_TIMEOUT", "15"))
+    # YouTube audio: seconds without data before a stalled stream fails, and
+    # the limit for a whole download
+    AUDIO_STALL_TIMEOUT = int(os.getenv("AUDIO_STALL_TIMEOUT", "30"))
+    AUDIO_DOWNLOAD_TIMEOUT = int(os.getenv("AUDIO_DOWNLOAD_TIMEOUT", "1800"))
     SUPPORTED_LANGUAGES = ["english", "spanish", "french", "german", "portuguese", "chinese"]
-    DEFAULT_LANGUAGE = "english"
+    # Whisper language codes; passing one skips language detection
+    LANGUAGE_CODES = {
+        "english": "en",
+        "spanish": "es",
+        "french": "fr",
+        "german": "de",
+        "portuguese": "pt",
+        "chinese": "zh",
+    }
+    # "auto" lets Whisper detect the spoken language
+    DEFAULT_LANGUAGE = "auto"
 
     # Cache Configuration
     ENABLE_CACHE = os.getenv("ENABLE_CACHE", "true").lower() == "true"
     CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "3600"))  # 1 hour
     MAX_CACHE_SIZE_MB = int(os.getenv("MAX_CACHE_SIZE_MB", "100"))
+    MAX_CACHE_ENTRIES = int(os.getenv("MAX_CACHE_ENTRIES", "512"))
+    CACHE_DIR = os.getenv("CACHE_DIR", "cache")
 
     # Rate Limiting
     ENABLE_RATE_LIMITING = os.getenv("ENABLE_RATE_LIMITING", "true").lower() == "true"
     RATE_LIMIT_CALLS = int(os.getenv("RATE_LIMIT_CALLS", "10"))
     RATE_LIMIT_PERIOD_SECONDS = int(os.getenv("RATE_LIMIT_PERIOD_SECONDS", "60"))
 
+    # API Server
+    # uvicorn worker processes. Each loads its own Whisper models and runs its
+    # own one-job-per-GPU scheduler, so keep 1 on GPU hosts; CPU-only
+    # deployments can raise it (e.g. to the CPU count) as memory allows.
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+
     # UI Configuration
     PAGE_TITLE = "🎯 Content Summarizer Pro"
     PAGE_ICON = "✨"
     THEME = os.getenv("THEME", "light")  # 'light' or 'dark'
+    MAX_HISTORY_ENTRIES = 50
+    HISTORY_DISPLAY_LIMIT = 10
 
     # Feature Flags
     ENABLE_HISTORY = os.getenv("ENABLE_HISTORY", "true").lower() == "true"
@@ -62,6 +119,11 @@ class Config:
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE = os.getenv("LOG_FILE", "logs/app.log")
     ENABLE_FILE_LOGGING = os.getenv("ENABLE_FILE_LOGGING", "true").lower() == "true"
+    LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+    LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "3"))
+    # Set by the API launcher for multi-worker runs: processes share the log
+    # file, so it is appended to and left for external rotation (logrotate)
+    LOG_EXTERNAL_ROTATION = os.getenv("LOG_EXTERNAL_ROTATION", "false").lower() == "true"
 
     # Security
     API_KEY_MIN_LENGTH = 10
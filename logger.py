@@ -4,6 +4,8 @@ Logging configuration and utilities for YT Web Summarizer.
 
 import logging
 import os
+import sys
+from logging.handlers import RotatingFileHandler, WatchedFileHandler
 from typing import Optional
 from config import current_config as config
 
@@ -20,27 +22,74 @@ class LogFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    def __init__(self, use_color: Optional[bool] = None):
+        """
+        Initialize formatter.
+
+        Args:
+            use_color: Emit ANSI colors (defaults to whether stderr is a TTY)
+        """
+        super().__init__()
+        if use_color is None:
+            use_color = sys.stderr.isatty()
+        # Level prefixes are built once instead of per record
+        self._prefixes = {
+            level: f"{color}[{level}]{self.RESET} " if use_color else f"[{level}] "
+            for level, color in self.COLORS.items()
+        }
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with color and additional info."""
-        level_name = record.levelname
-        color = self.COLORS.get(level_name, self.RESET)
-
-        # Enhanced formatting
-        log_message = (
-            f"{color}[{record.levelname}]{self.RESET} "
-            f"{record.name}:{record.lineno} - {record.getMessage()}"
-        )
+        prefix = self._prefixes.get(record.levelname) or f"[{record.levelname}] "
+        log_message = f"{prefix}{record.name}:{record.lineno} - {record.getMessage()}"
 
-        if record.exc_info:
-            log_message += f"\n{self.formatException(record.exc_info)}"
+        # Cache the traceback on the record, as logging.Formatter does
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_message += f"\n{record.exc_text}"
 
         return log_message
 
 
+_file_handler: Optional[logging.Handler] = None
+
+
+def _attach_file_handler() -> None:
+    """
+    Attach one log file handler to the root logger.
+
+    A single process rotates the file itself. Several API worker processes
+    would each rotate it on their own schedule and lose lines, so when the
+    launcher sets LOG_EXTERNAL_ROTATION they only append and reopen the file
+    once an external tool such as logrotate has moved it.
+    """
+    global _file_handler
+    if _file_handler is not None:
+        return
+
+    os.makedirs(os.path.dirname(config.LOG_FILE) or ".", exist_ok=True)
+    if config.LOG_EXTERNAL_ROTATION:
+        _file_handler = WatchedFileHandler(config.LOG_FILE)
+    else:
+        _file_handler = RotatingFileHandler(
+            config.LOG_FILE,
+            maxBytes=config.LOG_MAX_BYTES,
+            backupCount=config.LOG_BACKUP_COUNT,
+        )
+    _file_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    logging.getLogger().addHandler(_file_handler)
+
+
 def setup_logging(name: str, level: Optional[str] = None) -> logging.Logger:
     """
     Set up logging for a module.
 
+    Module loggers get their own console handler and reach the shared log
+    file through propagation to the root logger.
+
     Args:
         name: Logger name (usually __name__)
         level: Log level (defaults to config.LOG_LEVEL)
@@ -58,16 +107,9 @@ def setup_logging(name: str, level: Optional[str] = None) -> logging.Logger:
         console_handler.setFormatter(LogFormatter())
         logger.addHandler(console_handler)
 
-        # File handler if enabled
-        if config.ENABLE_FILE_LOGGING:
-            os.makedirs(os.path.dirname(config.LOG_FILE) or ".", exist_ok=True)
-            file_handler = logging.FileHandler(config.LOG_FILE)
-            file_handler.setFormatter(
-                logging.Formatter(
-                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-                )
-            )
-            logger.addHandler(file_handler)
+    # File handler if enabled
+    if config.ENABLE_FILE_LOGGING:
+        _attach_file_handler()
 
     return logger
 
@@ -2,17 +2,26 @@
 Services for content processing: YouTube, Website, and LLM integration.
 """
 
+import asyncio
+import codecs
+import hashlib
 import os
-import tempfile
-from typing import List, Optional
-import torch
-import whisper
-import yt_dlp
-from langchain_community.document_loaders import WebBaseLoader
+import re
+import subprocess
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+import httpx
+import numpy as np
+import tiktoken
+from selectolax.lexbor import LexborHTMLParser
 from langchain_core.documents import Document
 from langchain.prompts import PromptTemplate
 from langchain_groq import ChatGroq
-from langchain.chains.summarize import load_summarize_chain
+from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from logger import setup_logging
 from exceptions import (
@@ -23,41 +32,212 @@ from exceptions import (
     GroqAPIException,
 )
 from config import current_config as config
+from utils import DiskCache, SimpleCache, URLValidator
+
+# ctranslate2, faster_whisper and yt_dlp take seconds to import and are only needed
+# for YouTube, so they are imported inside the functions that use them.
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
 
 logger = setup_logging(__name__)
 
+# Whisper expects 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+_transcript_cache = DiskCache(
+    os.path.join(config.CACHE_DIR, "transcripts"),
+    max_bytes=config.MAX_CACHE_SIZE_MB * 1024 * 1024,
+)
+
+# Style-specific summary prompts; {length} is filled per request.
+PROMPT_TEMPLATES = {
+    "balanced": """Provide a balanced summary of the following content in approximately {length} words. 
+Cover the main points clearly and concisely:
+Content:{text}
+Summary:""",
+    "bullet_points": """Summarize the following content as concise bullet points (5-8 points). 
+Focus on key takeaways:
+Content:{text}
+Summary:""",
+    "executive": """Create an executive summary of the following content in {length} words. 
+Include key findings and recommendations:
+Content:{text}
+Summary:""",
+    "technical": """Provide a technical summary of the following content in {length} words. 
+Focus on technical details and specifications:
+Content:{text}
+Summary:""",
+    "simplified": """Explain the following content in simple terms ({length} words). 
+Make it understandable to non-experts:
+Content:{text}
+Summary:""",
+}
+
+# Prompt for the map step of map-reduce summarization; the combine step uses
+# the style-specific prompt from SummarizationService.get_summary_prompt.
+MAP_PROMPT = PromptTemplate(
+    template="""Write a concise summary of the following content, keeping all key facts:
+Content:{text}
+Summary:""",
+    input_variables=["text"],
+)
+
+# Finished summaries keyed by content digest, shared by every API key
+_summary_cache = SimpleCache(
+    ttl_seconds=config.CACHE_TTL_SECONDS, maxsize=config.MAX_CACHE_ENTRIES
+)
+
+# Website connections are kept alive between requests. An AsyncClient is bound
+# to the event loop it first ran on, so each loop gets its own.
+_async_http_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+_text_splitter = RecursiveCharacterTextSplitter(
+    chunk_size=config.CHUNK_SIZE, chunk_overlap=config.CHUNK_OVERLAP
+)
+
+
+@lru_cache(maxsize=None)
+def get_whisper_device() -> str:
+    """Resolve the configured Whisper device once, expanding 'auto'."""
+    if config.WHISPER_DEVICE == "auto":
+        # ctranslate2 ships with faster-whisper and imports far faster than torch
+        import ctranslate2
+
+        return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    return config.WHISPER_DEVICE
+
+
+def get_whisper_compute_type(device: str) -> str:
+    """
+    Resolve the CTranslate2 compute type for a device.
+
+    Args:
+        device: Device the model runs on ('cuda' or 'cpu')
+
+    Returns:
+        Configured compute type, or int8_float16 on CUDA / int8 on CPU for 'auto'
+    """
+    if config.WHISPER_COMPUTE_TYPE != "auto":
+        return config.WHISPER_COMPUTE_TYPE
+    return "int8_float16" if device == "cuda" else "int8"
+
+
+def resolve_whisper_model(model_size: str, language: Optional[str]) -> str:
+    """
+    Pick the English-only variant of a Whisper model for English content.
+
+    Args:
+        model_size: Requested Whisper model size
+        language: Content language (e.g. 'english'); None means detect it
+
+    Returns:
+        The '.en' model name when one exists and English was chosen,
+        otherwise the requested model size
+    """
+    if language and language.lower() == "english":
+        english_model = f"{model_size}.en"
+        if english_model in config.ENGLISH_WHISPER_MODELS:
+            return english_model
+    return model_size
+
+
+# Loaded models keyed by (model_size, device, compute_type), least recently
+# used first. Every selectable model fits, so switching sizes in the UI never
+# evicts one, but the cache never grows past that.
+_WHISPER_MODEL_CACHE_SIZE = len(config.WHISPER_MODELS) + len(config.ENGLISH_WHISPER_MODELS)
+_whisper_models: "OrderedDict[Tuple[str, str, str], WhisperModel]" = OrderedDict()
+# Guards _whisper_models and _whisper_load_locks; never held while loading
+_whisper_models_lock = threading.Lock()
+_whisper_load_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+
+
+def _get_whisper_model(
+    model_size: str, device: str, compute_type: str
+) -> "WhisperModel":
+    """
+    Load a faster-whisper model once per process.
+
+    Each model has its own load lock, so concurrent first requests for one
+    model wait for a single load while other models load in parallel.
+
+    Args:
+        model_size: Whisper model size (base, small, medium, large)
+        device: Device to load the model on ('cuda' or 'cpu')
+        compute_type: CTranslate2 compute type (e.g. 'float16', 'int8')
+
+    Returns:
+        Loaded WhisperModel instance
+    """
+    key = (model_size, device, compute_type)
+    with _whisper_models_lock:
+        model = _whisper_models.get(key)
+        if model is not None:
+            _whisper_models.move_to_end(key)
+            return model
+        load_lock = _whisper_load_locks.setdefault(key, threading.Lock())
+
+    with load_lock:
+        with _whisper_models_lock:
+            model = _whisper_models.get(key)
+        if model is not None:
+            return model
+
+        from faster_whisper import WhisperModel
+
+        logger.info(f"Loading Whisper model: {model_size} ({device}, {compute_type})")
+        if device == "cuda":
+            # One replica per listed GPU (num_workers is replicas per device);
+            # concurrent calls run on different GPUs
+            model = WhisperModel(
+                model_size,
+                device=device,
+                device_index=config.WHISPER_DEVICE_INDEX,
+                compute_type=compute_type,
+                num_workers=1,
+            )
+        else:
+            model = WhisperModel(model_size, device=device, compute_type=compute_type)
+
+        with _whisper_models_lock:
+            _whisper_models[key] = model
+            while len(_whisper_models) > _WHISPER_MODEL_CACHE_SIZE:
+                evicted, _ = _whisper_models.popitem(last=False)
+                logger.info(f"Evicted Whisper model: {evicted[0]}")
+    return model
+
 
 class YouTubeService:
     """Service for processing YouTube videos."""
 
     @staticmethod
-    def download_and_transcribe(
-        url: str, whisper_model_size: str = "base"
-    ) -> str:
+    def load_audio(url: str) -> np.ndarray:
         """
-        Download YouTube video and transcribe audio.
+        Stream the audio track of a YouTube video into memory.
+
+        yt-dlp resolves the audio stream URL and ffmpeg decodes it straight
+        to 16 kHz mono PCM on a pipe, so nothing is written to disk.
 
         Args:
             url: YouTube URL
-            whisper_model_size: Whisper model size (base, small, medium, large)
 
         Returns:
-            Transcribed text
+            Float32 waveform sampled at SAMPLE_RATE
 
         Raises:
-            YouTubeProcessingException: If download fails
-            TranscriptionException: If transcription fails
+            YouTubeProcessingException: If download or decoding fails
         """
         try:
             logger.info(f"Starting YouTube download: {url}")
 
             # Configure yt-dlp options with comprehensive headers and options for YouTube
             ydl_opts = {
-                "format": "bestaudio[ext=m4a]/bestaudio/best",
+                # Whisper resamples to 16 kHz mono, so a ~70 kbps opus/m4a
+                # stream carries all it needs at half the download and decode
+                "format": "bestaudio[abr<=96]/bestaudio/best",
                 "quiet": False,
                 "no_warnings": False,
                 "noplaylist": True,
-                "socket_timeout": 30,
+                "socket_timeout": config.AUDIO_STALL_TIMEOUT,
                 "extractor_args": {
                     "youtube": {
                         "player_client": ["web"],
@@ -72,54 +252,61 @@ class YouTubeService:
                     "Connection": "keep-alive",
                     "Upgrade-Insecure-Requests": "1",
                 },
-                "postprocessors": [
-                    {
-                        "key": "FFmpegExtractAudio",
-                        "preferredcodec": "mp3",
-                        "preferredquality": "192",
-                    }
-                ],
             }
 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                audio_path = os.path.join(tmpdir, "temp_audio.%(ext)s")
-                ydl_opts["outtmpl"] = audio_path
-
-                # Download audio
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(url, download=True)
-                    logger.info(f"Downloaded: {info.get('title', 'Unknown')}")
+            import yt_dlp
 
-                audio_file = os.path.join(tmpdir, "temp_audio.mp3")
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.extract_info(url, download=False)
+                logger.info(f"Streaming audio: {info.get('title', 'Unknown')}")
 
-                if not os.path.exists(audio_file):
-                    raise YouTubeProcessingException(
-                        "Audio file not found after download."
-                    )
+            stream_url = info.get("url")
+            if not stream_url:
+                raise YouTubeProcessingException("No audio stream found for this video.")
 
-                # Transcribe using Whisper
-                logger.info(f"Transcribing with Whisper ({whisper_model_size})...")
-                device = (
-                    "cuda"
-                    if config.WHISPER_DEVICE == "auto" and torch.cuda.is_available()
-                    else config.WHISPER_DEVICE
+            headers = "".join(
+                f"{name}: {value}\r\n"
+                for name, value in (info.get("http_headers") or {}).items()
+            )
+            command = ["ffmpeg", "-nostdin", "-loglevel", "error"]
+            if headers:
+                command += ["-headers", headers]
+            command += [
+                "-reconnect", "1",
+                "-reconnect_streamed", "1",
+                "-reconnect_delay_max", "5",
+                # Microseconds; a stalled read fails instead of hanging
+                "-rw_timeout", str(config.AUDIO_STALL_TIMEOUT * 1_000_000),
+                "-i", stream_url,
+                "-f", "s16le",
+                "-ac", "1",
+                "-ar", str(SAMPLE_RATE),
+                "-",
+            ]
+            try:
+                result = subprocess.run(
+                    command, capture_output=True, timeout=config.AUDIO_DOWNLOAD_TIMEOUT
+                )
+            except subprocess.TimeoutExpired:
+                logger.error(
+                    f"Audio download timed out after {config.AUDIO_DOWNLOAD_TIMEOUT}s"
+                )
+                raise YouTubeProcessingException(
+                    "Failed to process YouTube video: audio download timed out.",
+                    details={"timeout_seconds": config.AUDIO_DOWNLOAD_TIMEOUT},
+                )
+            if result.returncode != 0 or not result.stdout:
+                raise YouTubeProcessingException(
+                    "Failed to decode audio stream.",
+                    details={"ffmpeg_error": result.stderr.decode(errors="ignore")[-500:]},
                 )
-                model = whisper.load_model(whisper_model_size, device=device)
-                result = model.transcribe(audio_file)
-                transcript = result.get("text", "").strip()
-
-                if not transcript:
-                    raise TranscriptionException(
-                        "Transcription resulted in empty text."
-                    )
 
-                logger.info("Transcription completed successfully")
-                return transcript
+            audio = np.frombuffer(result.stdout, np.int16).astype(np.float32) / 32768.0
+            logger.info(f"Decoded {len(audio) / SAMPLE_RATE:.0f}s of audio")
+            return audio
 
         except YouTubeProcessingException:
             raise
-        except TranscriptionException:
-            raise
         except Exception as e:
             logger.error(f"YouTube processing error: {str(e)}")
             raise YouTubeProcessingException(
@@ -127,14 +314,387 @@ class YouTubeService:
                 details={"original_error": str(e)},
             )
 
+    @staticmethod
+    def transcribe_audio(
+        audio: Union[str, np.ndarray],
+        whisper_model_size: str = "base",
+        language: Optional[str] = None,
+    ) -> str:
+        """
+        Transcribe audio with Whisper.
+
+        Unless WHISPER_BATCH_SIZE is 1 or WHISPER_VAD_FILTER is off, the audio
+        is split on speech boundaries and decoded through faster-whisper's
+        batched pipeline, so several 30-second windows share one encoder call.
+
+        Args:
+            audio: Path to an audio file, or a waveform at SAMPLE_RATE
+            whisper_model_size: Whisper model size (base, small, medium, large)
+            language: Content language (e.g. 'english'); None detects it
+
+        Returns:
+            Transcribed text
+
+        Raises:
+            TranscriptionException: If transcription fails
+        """
+        try:
+            logger.info(f"Transcribing with Whisper ({whisper_model_size})...")
+            device = get_whisper_device()
+            compute_type = get_whisper_compute_type(device)
+            model = _get_whisper_model(whisper_model_size, device, compute_type)
+            # A known language skips detection, which costs an extra encoder pass
+            language_code = config.LANGUAGE_CODES.get((language or "").lower())
+
+            # The batched pipeline finds its windows with VAD and cannot run
+            # without it, so disabling VAD falls back to sequential decoding
+            if config.WHISPER_BATCH_SIZE > 1 and config.WHISPER_VAD_FILTER:
+                from faster_whisper import BatchedInferencePipeline
+
+                segments, _ = BatchedInferencePipeline(model=model).transcribe(
+                    audio,
+                    language=language_code,
+                    beam_size=config.WHISPER_BEAM_SIZE,
+                    vad_filter=True,
+                    batch_size=config.WHISPER_BATCH_SIZE,
+                )
+            else:
+                segments, _ = model.transcribe(
+                    audio,
+                    language=language_code,
+                    beam_size=config.WHISPER_BEAM_SIZE,
+                    vad_filter=config.WHISPER_VAD_FILTER,
+                )
+            transcript = " ".join(s.text.strip() for s in segments).strip()
+
+            if not transcript:
+                raise TranscriptionException("Transcription resulted in empty text.")
+
+            logger.info("Transcription completed successfully")
+            return transcript
+
+        except TranscriptionException:
+            raise
+        except Exception as e:
+            logger.error(f"Transcription error: {str(e)}")
+            raise TranscriptionException(
+                f"Failed to transcribe audio: {str(e)}",
+                details={"original_error": str(e)},
+            )
+
+    @staticmethod
+    def _transcript_cache_key(
+        url: str, whisper_model_size: str, language: Optional[str]
+    ) -> Optional[str]:
+        """Build the transcript cache key from the video ID, model and language."""
+        video_id = URLValidator.get_youtube_video_id(url)
+        if not video_id:
+            return None
+        return f"{video_id}_{whisper_model_size}_{(language or 'auto').lower()}"
+
+    @staticmethod
+    def load_cached_transcript(
+        url: str, whisper_model_size: str, language: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Look up a previously stored transcript.
+
+        Args:
+            url: YouTube URL
+            whisper_model_size: Whisper model size the transcript was made with
+            language: Language the transcript was forced to; None if detected
+
+        Returns:
+            Cached transcript, or None on a miss or when caching is disabled
+        """
+        key = YouTubeService._transcript_cache_key(url, whisper_model_size, language)
+        if not config.ENABLE_CACHE or key is None:
+            return None
+        return _transcript_cache.get(key)
+
+    @staticmethod
+    def save_transcript(
+        url: str,
+        whisper_model_size: str,
+        transcript: str,
+        language: Optional[str] = None,
+    ) -> None:
+        """
+        Store a transcript for later requests.
+
+        Args:
+            url: YouTube URL
+            whisper_model_size: Whisper model size the transcript was made with
+            transcript: Transcribed text
+            language: Language the transcript was forced to; None if detected
+        """
+        key = YouTubeService._transcript_cache_key(url, whisper_model_size, language)
+        if config.ENABLE_CACHE and key is not None:
+            _transcript_cache.set(key, transcript)
+
+    @staticmethod
+    def preload_model(whisper_model_size: str = "base") -> None:
+        """
+        Load a Whisper model into the process-wide cache ahead of use.
+
+        Args:
+            whisper_model_size: Whisper model size
+
+        Raises:
+            TranscriptionException: If the model cannot be loaded
+        """
+        try:
+            device = get_whisper_device()
+            _get_whisper_model(
+                whisper_model_size, device, get_whisper_compute_type(device)
+            )
+        except Exception as e:
+            logger.error(f"Whisper model load error: {str(e)}")
+            raise TranscriptionException(
+                f"Failed to load Whisper model: {str(e)}",
+                details={"original_error": str(e)},
+            )
+
+    @staticmethod
+    async def get_transcript_async(
+        url: str, whisper_model_size: str = "base", language: Optional[str] = None
+    ) -> str:
+        """
+        Return a transcript from the persistent cache, transcribing on a miss.
+
+        Transcripts depend only on the video, the Whisper model and the
+        language, so they are reused across summary styles, lengths and
+        sessions. On a cache miss the audio download and the Whisper model
+        load run concurrently in worker threads, so a cold model no longer
+        waits for the download to finish.
+
+        Args:
+            url: YouTube URL
+            whisper_model_size: Whisper model size
+            language: Content language (e.g. 'english'); None detects it
+
+        Returns:
+            Transcribed text
+        """
+        transcript = YouTubeService.load_cached_transcript(
+            url, whisper_model_size, language
+        )
+        if transcript is not None:
+            logger.info("Using cached transcript")
+            return transcript
+
+        audio, _ = await asyncio.gather(
+            asyncio.to_thread(YouTubeService.load_audio, url),
+            asyncio.to_thread(YouTubeService.preload_model, whisper_model_size),
+        )
+        transcript = await asyncio.to_thread(
+            YouTubeService.transcribe_audio, audio, whisper_model_size, language
+        )
+        YouTubeService.save_transcript(
+            url, whisper_model_size, transcript, language
+        )
+        return transcript
+
+
+# Rough English average, used when the tokenizer cannot be loaded
+CHARS_PER_TOKEN = 4
+
+
+# tiktoken downloads the encoding on first use without a timeout, so it is
+# loaded in a background thread and callers wait for it only briefly
+_token_encoding: Optional[tiktoken.Encoding] = None
+_token_encoding_loaded = threading.Event()
+_token_encoding_lock = threading.Lock()
+_token_encoding_started = False
+_token_encoding_timed_out = False
+
+
+def _load_token_encoding() -> None:
+    """Load the tokenizer and signal waiting callers."""
+    global _token_encoding
+    try:
+        _token_encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(
+            f"Token encoding unavailable, truncating by characters instead: {str(e)}"
+        )
+    finally:
+        _token_encoding_loaded.set()
+
+
+def warm_token_encoding() -> None:
+    """Start loading the tokenizer in a background thread, once per process."""
+    global _token_encoding_started
+    with _token_encoding_lock:
+        if _token_encoding_started:
+            return
+        _token_encoding_started = True
+    threading.Thread(
+        target=_load_token_encoding, name="token-encoding-loader", daemon=True
+    ).start()
+
+
+def _get_token_encoding() -> Optional[tiktoken.Encoding]:
+    """
+    Get the tokenizer used to measure website content.
+
+    Waits up to TOKENIZER_LOAD_TIMEOUT for the first load. If the download
+    stalls or fails (e.g. offline deployments), None is returned and callers
+    fall back to counting characters; later calls no longer wait.
+    """
+    global _token_encoding_timed_out
+    warm_token_encoding()
+    if _token_encoding_timed_out and not _token_encoding_loaded.is_set():
+        return None
+    if not _token_encoding_loaded.wait(config.TOKENIZER_LOAD_TIMEOUT):
+        _token_encoding_timed_out = True
+        logger.warning(
+            "Token encoding still loading, truncating by characters instead"
+        )
+        return None
+    return _token_encoding
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate text to at most max_tokens tokens.
+
+    Every token covers at least one UTF-8 byte, so text with no more bytes
+    than max_tokens is returned without tokenizing it. Without the tokenizer
+    the limit is approximated as CHARS_PER_TOKEN characters per token.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum number of tokens to keep
+
+    Returns:
+        Original or truncated text
+    """
+    if len(text.encode("utf-8")) <= max_tokens:
+        return text
+    encoding = _get_token_encoding()
+    if encoding is None:
+        return text[: max_tokens * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
 
 class WebsiteService:
     """Service for processing website content."""
 
+    # <meta charset="..."> or <meta http-equiv=... content="...; charset=...">
+    META_CHARSET_REGEX = re.compile(
+        rb"<meta[^>]+charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE
+    )
+    # Elements that never carry article text
+    STRIP_SELECTOR = "script,style,noscript,nav,header,footer"
+    REQUEST_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+    }
+
+    @staticmethod
+    def extract_documents(url: str, html: str) -> List[Document]:
+        """
+        Extract readable text from HTML.
+
+        Args:
+            url: Source URL, stored in document metadata
+            html: Raw HTML
+
+        Returns:
+            List containing a single Document
+
+        Raises:
+            WebsiteProcessingException: If no readable text is found
+        """
+        tree = LexborHTMLParser(html)
+        for node in tree.css(WebsiteService.STRIP_SELECTOR):
+            node.decompose()
+
+        title_node = tree.css_first("title")
+        root = tree.body or tree.root
+        text = root.text(separator=" ", strip=True) if root else ""
+
+        if not text.strip():
+            raise WebsiteProcessingException("Website content is empty or not readable.")
+
+        # Truncate content to manageable size
+        truncated = truncate_to_tokens(text, config.MAX_WEBSITE_CONTENT_TOKENS)
+        if len(truncated) < len(text):
+            text = truncated
+            logger.info(
+                f"Content truncated to {config.MAX_WEBSITE_CONTENT_TOKENS} tokens"
+            )
+
+        metadata = {"source": url}
+        if title_node is not None:
+            metadata["title"] = title_node.text(strip=True)
+        return [Document(page_content=text, metadata=metadata)]
+
+    @staticmethod
+    def _get_async_client() -> httpx.AsyncClient:
+        """Get the HTTP/2 client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = _async_http_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                headers=WebsiteService.REQUEST_HEADERS,
+                timeout=config.WEBSITE_TIMEOUT,
+                follow_redirects=True,
+                http2=True,
+            )
+            _async_http_clients[loop] = client
+        return client
+
+    @staticmethod
+    async def close_async_client() -> None:
+        """
+        Close the running event loop's HTTP client.
+
+        Call before a short-lived loop (e.g. one asyncio.run) finishes so its
+        connections are not leaked.
+        """
+        client = _async_http_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
     @staticmethod
-    def load_and_extract(url: str) -> List[Document]:
+    def _decode_html(body: bytes, header_charset: Optional[str]) -> str:
         """
-        Load and extract content from website.
+        Decode a possibly truncated HTML body.
+
+        The charset comes from the Content-Type header, then the page's
+        <meta charset> tag, then defaults to UTF-8.
+
+        Args:
+            body: Raw HTML bytes
+            header_charset: Charset from the Content-Type header, if any
+
+        Returns:
+            Decoded HTML
+        """
+        body = body[: config.MAX_WEBSITE_HTML_BYTES]
+        candidates = [header_charset]
+        match = WebsiteService.META_CHARSET_REGEX.search(body, 0, 4096)
+        if match:
+            candidates.append(match.group(1).decode("ascii"))
+        for charset in candidates:
+            if charset:
+                try:
+                    codecs.lookup(charset)
+                except LookupError:
+                    continue
+                return body.decode(charset, errors="replace")
+        return body.decode("utf-8", errors="replace")
+
+    @staticmethod
+    async def load_and_extract_async(url: str) -> List[Document]:
+        """
+        Load and extract content from website without blocking the event loop.
 
         Args:
             url: Website URL
@@ -148,30 +708,21 @@ class WebsiteService:
         try:
             logger.info(f"Loading website content: {url}")
 
-            loader = WebBaseLoader(url)
-            docs = loader.load()
-
-            if not docs:
-                raise WebsiteProcessingException(
-                    "No content found on the website."
+            client = WebsiteService._get_async_client()
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body += chunk
+                    if len(body) >= config.MAX_WEBSITE_HTML_BYTES:
+                        break
+                html = WebsiteService._decode_html(
+                    bytes(body), response.charset_encoding
                 )
+            # Parsing and tokenizing are CPU-bound; keep them off the event loop
+            docs = await asyncio.to_thread(WebsiteService.extract_documents, url, html)
 
-            if not docs[0].page_content.strip():
-                raise WebsiteProcessingException(
-                    "Website content is empty or not readable."
-                )
-
-            # Truncate content to manageable size
-            for doc in docs:
-                if len(doc.page_content) > config.MAX_WEBSITE_CONTENT_LENGTH:
-                    doc.page_content = doc.page_content[
-                        : config.MAX_WEBSITE_CONTENT_LENGTH
-                    ]
-                    logger.info(
-                        f"Content truncated to {config.MAX_WEBSITE_CONTENT_LENGTH} characters"
-                    )
-
-            logger.info(f"Successfully loaded content from website")
+            logger.info("Successfully loaded content from website")
             return docs
 
         except WebsiteProcessingException:
@@ -184,6 +735,45 @@ class WebsiteService:
             )
 
 
+@lru_cache(maxsize=32)
+def _get_llm(api_key: str) -> ChatGroq:
+    """
+    Create one ChatGroq client per API key and process.
+
+    Sharing the client lets every service instance reuse its HTTP
+    connection pool instead of paying a TLS handshake per summary.
+
+    Args:
+        api_key: Groq API key
+
+    Returns:
+        ChatGroq client
+    """
+    return ChatGroq(
+        model=config.GROQ_MODEL,
+        groq_api_key=api_key,
+        temperature=0.5,
+        max_retries=config.GROQ_MAX_RETRIES,
+        timeout=config.GROQ_TIMEOUT,
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_summary_prompt(style: str, length: int) -> PromptTemplate:
+    """
+    Parse a style prompt and bind its length once per (style, length).
+
+    Args:
+        style: Summarization style; unknown styles fall back to balanced
+        length: Target summary length in words
+
+    Returns:
+        PromptTemplate expecting only {text}
+    """
+    template = PROMPT_TEMPLATES.get(style, PROMPT_TEMPLATES["balanced"])
+    return PromptTemplate.from_template(template).partial(length=str(length))
+
+
 class SummarizationService:
     """Service for content summarization using LLM."""
 
@@ -201,12 +791,7 @@ class SummarizationService:
         """Get or create LLM instance."""
         if self._llm is None:
             try:
-                self._llm = ChatGroq(
-                    model=config.GROQ_MODEL,
-                    groq_api_key=self.api_key,
-                    temperature=0.5,
-                    max_retries=config.GROQ_MAX_RETRIES,
-                )
+                self._llm = _get_llm(self.api_key)
             except Exception as e:
                 logger.error(f"Failed to initialize ChatGroq: {str(e)}")
                 raise GroqAPIException(
@@ -228,31 +813,165 @@ class SummarizationService:
         Returns:
             PromptTemplate object
         """
-        prompts = {
-            "balanced": f"""Provide a balanced summary of the following content in approximately {length} words. 
-Cover the main points clearly and concisely:
-Content:{{text}}
-Summary:""",
-            "bullet_points": f"""Summarize the following content as concise bullet points (5-8 points). 
-Focus on key takeaways:
-Content:{{text}}
-Summary:""",
-            "executive": f"""Create an executive summary of the following content in {length} words. 
-Include key findings and recommendations:
-Content:{{text}}
-Summary:""",
-            "technical": f"""Provide a technical summary of the following content in {length} words. 
-Focus on technical details and specifications:
-Content:{{text}}
-Summary:""",
-            "simplified": f"""Explain the following content in simple terms ({length} words). 
-Make it understandable to non-experts:
-Content:{{text}}
-Summary:""",
-        }
+        return _build_summary_prompt(style, length)
+
+    @staticmethod
+    def _split_documents(docs: List[Document]) -> Optional[List[Document]]:
+        """
+        Split long content into chunks for the map step.
+
+        Args:
+            docs: List of documents to summarize
+
+        Returns:
+            Chunks to summarize separately, or None when the content fits
+            in a single prompt
+        """
+        if sum(len(doc.page_content) for doc in docs) <= config.MAX_SINGLE_PROMPT_CHARS:
+            return None
+        return _text_splitter.split_documents(docs)
+
+    def _prepare_text(self, docs: List[Document]) -> str:
+        """
+        Build the text for the final summary prompt.
+
+        Long content is split and the chunks are summarized in one
+        concurrent batch of LLM calls. The joined partial summaries are
+        split and summarized again until they fit in a single prompt.
+
+        Args:
+            docs: List of documents to summarize
+
+        Returns:
+            Content, or the collapsed partial summaries for long content
+        """
+        chunks = self._split_documents(docs)
+        while chunks is not None:
+            messages = self.get_llm().batch(
+                [MAP_PROMPT.format(text=chunk.page_content) for chunk in chunks],
+                config={"max_concurrency": config.MAX_CONCURRENT_CHUNKS},
+            )
+            logger.info(f"Summarized {len(chunks)} chunks concurrently")
+            docs, chunks = self._collapse(docs, messages)
+        return "\n\n".join(doc.page_content for doc in docs)
+
+    async def _aprepare_text(self, docs: List[Document]) -> str:
+        """Async variant of _prepare_text."""
+        chunks = self._split_documents(docs)
+        while chunks is not None:
+            messages = await self.get_llm().abatch(
+                [MAP_PROMPT.format(text=chunk.page_content) for chunk in chunks],
+                config={"max_concurrency": config.MAX_CONCURRENT_CHUNKS},
+            )
+            logger.info(f"Summarized {len(chunks)} chunks concurrently")
+            docs, chunks = self._collapse(docs, messages)
+        return "\n\n".join(doc.page_content for doc in docs)
+
+    @staticmethod
+    def _collapse(
+        docs: List[Document], messages: list
+    ) -> Tuple[List[Document], Optional[List[Document]]]:
+        """
+        Turn one round of partial summaries into the next round's input.
+
+        Args:
+            docs: Documents the round summarized
+            messages: LLM replies, one per chunk
+
+        Returns:
+            The joined partial summaries as a document, and their chunks when
+            they still do not fit in a single prompt (None otherwise)
+        """
+        # Joined first so the splitter packs several short summaries per chunk
+        partials = [
+            Document(page_content="\n\n".join(message.content for message in messages))
+        ]
+        chunks = SummarizationService._split_documents(partials)
+        if chunks is not None:
+            before = sum(len(doc.page_content) for doc in docs)
+            after = sum(len(doc.page_content) for doc in partials)
+            if after >= before:
+                # Another round would not shrink the text; stop instead of looping
+                logger.warning("Partial summaries did not shrink; skipping collapse")
+                chunks = None
+        return partials, chunks
+
+    @staticmethod
+    def _summary_cache_key(docs: List[Document], style: str, length: int) -> str:
+        """Key a summary by model, options and a digest of the content."""
+        digest = hashlib.blake2b(digest_size=16)
+        for doc in docs:
+            digest.update(doc.page_content.encode())
+            digest.update(b"\0")
+        return f"{config.GROQ_MODEL}|{style}|{length}|{digest.hexdigest()}"
 
-        template = prompts.get(style, prompts["balanced"])
-        return PromptTemplate(template=template, input_variables=["text"])
+    def _lookup_summary(
+        self, docs: List[Document], style: str, length: int
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Validate a request and look up a previously generated summary.
+
+        Args:
+            docs: List of documents to summarize
+            style: Summarization style
+            length: Target summary length in words
+
+        Returns:
+            The summary cache key, and the cached summary or None
+
+        Raises:
+            SummarizationException: If no documents were provided
+        """
+        logger.info(f"Starting summarization ({style} style, {length} words)")
+        if not docs:
+            raise SummarizationException("No documents provided for summarization")
+
+        key = self._summary_cache_key(docs, style, length)
+        if not config.ENABLE_CACHE:
+            return key, None
+        summary = _summary_cache.get(key)
+        if summary is not None:
+            logger.info("Using cached summary")
+        return key, summary
+
+    @staticmethod
+    def _store_summary(key: str, summary: Optional[str]) -> str:
+        """
+        Check a generated summary and cache it.
+
+        Args:
+            key: Summary cache key from _lookup_summary
+            summary: Raw LLM output
+
+        Returns:
+            The stripped summary
+
+        Raises:
+            SummarizationException: If the LLM returned no text
+        """
+        summary = (summary or "").strip()
+        if not summary:
+            raise SummarizationException("Summarization resulted in empty output")
+
+        logger.info("Summarization completed successfully")
+        if config.ENABLE_CACHE:
+            _summary_cache.set(key, summary)
+        return summary
+
+    @staticmethod
+    @contextmanager
+    def _summarization_errors() -> Iterator[None]:
+        """Wrap unexpected errors in SummarizationException."""
+        try:
+            yield
+        except SummarizationException:
+            raise
+        except Exception as e:
+            logger.error(f"Summarization error: {str(e)}")
+            raise SummarizationException(
+                f"Failed to summarize content: {str(e)}",
+                details={"original_error": str(e)},
+            )
 
     def summarize(
         self,
@@ -274,31 +993,118 @@ Summary:""",
         Raises:
             SummarizationException: If summarization fails
         """
-        try:
-            logger.info(f"Starting summarization ({style} style, {length} words)")
+        with self._summarization_errors():
+            key, cached = self._lookup_summary(docs, style, length)
+            if cached is not None:
+                return cached
+
+            prompt = self.get_summary_prompt(style, length)
+            text = self._prepare_text(docs)
+            message = self.get_llm().invoke(prompt.format(text=text))
+            return self._store_summary(key, message.content)
 
-            if not docs:
-                raise SummarizationException("No documents provided for summarization")
+    async def summarize_async(
+        self,
+        docs: List[Document],
+        style: str = "balanced",
+        length: int = 300,
+    ) -> str:
+        """
+        Summarize documents without blocking the event loop.
+
+        Long content is split into chunks that are summarized concurrently
+        (map step, bounded by config.MAX_CONCURRENT_CHUNKS) and the partial
+        summaries are then combined in the requested style.
+
+        Args:
+            docs: List of documents to summarize
+            style: Summarization style
+            length: Target summary length in words
+
+        Returns:
+            Summary text
+
+        Raises:
+            SummarizationException: If summarization fails
+        """
+        with self._summarization_errors():
+            key, cached = self._lookup_summary(docs, style, length)
+            if cached is not None:
+                return cached
 
-            llm = self.get_llm()
             prompt = self.get_summary_prompt(style, length)
+            text = await self._aprepare_text(docs)
+            message = await self.get_llm().ainvoke(prompt.format(text=text))
+            return self._store_summary(key, message.content)
 
-            chain = load_summarize_chain(
-                llm, chain_type="stuff", prompt=prompt
-            )
-            summary = chain.run(docs)
+    def summarize_stream(
+        self,
+        docs: List[Document],
+        style: str = "balanced",
+        length: int = 300,
+    ) -> Iterator[str]:
+        """
+        Summarize documents, yielding text chunks as the LLM generates them.
 
-            if not summary or not summary.strip():
-                raise SummarizationException("Summarization resulted in empty output")
+        A cached summary is yielded as a single chunk.
 
-            logger.info("Summarization completed successfully")
-            return summary.strip()
+        Args:
+            docs: List of documents to summarize
+            style: Summarization style
+            length: Target summary length in words
 
-        except SummarizationException:
-            raise
-        except Exception as e:
-            logger.error(f"Summarization error: {str(e)}")
-            raise SummarizationException(
-                f"Failed to summarize content: {str(e)}",
-                details={"original_error": str(e)},
-            )
+        Yields:
+            Summary text chunks
+
+        Raises:
+            SummarizationException: If summarization fails
+        """
+        with self._summarization_errors():
+            key, cached = self._lookup_summary(docs, style, length)
+            if cached is not None:
+                yield cached
+                return
+
+            prompt = self.get_summary_prompt(style, length)
+            text = self._prepare_text(docs)
+            parts: List[str] = []
+            for chunk in self.get_llm().stream(prompt.format(text=text)):
+                if chunk.content:
+                    parts.append(chunk.content)
+                    yield chunk.content
+            self._store_summary(key, "".join(parts))
+
+    async def summarize_stream_async(
+        self,
+        docs: List[Document],
+        style: str = "balanced",
+        length: int = 300,
+    ) -> AsyncIterator[str]:
+        """
+        Async variant of summarize_stream for use inside an event loop.
+
+        Args:
+            docs: List of documents to summarize
+            style: Summarization style
+            length: Target summary length in words
+
+        Yields:
+            Summary text chunks
+
+        Raises:
+            SummarizationException: If summarization fails
+        """
+        with self._summarization_errors():
+            key, cached = self._lookup_summary(docs, style, length)
+            if cached is not None:
+                yield cached
+                return
+
+            prompt = self.get_summary_prompt(style, length)
+            text = await self._aprepare_text(docs)
+            parts: List[str] = []
+            async for chunk in self.get_llm().astream(prompt.format(text=text)):
+                if chunk.content:
+                    parts.append(chunk.content)
+                    yield chunk.content
+            self._store_summary(key, "".join(parts))
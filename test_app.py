@@ -7,12 +7,24 @@ from utils import (
     URLValidator,
     APIKeyValidator,
     SimpleCache,
+    DiskCache,
     RateLimiter,
     sanitize_text,
     estimate_reading_time,
+    count_words,
+    summary_stats,
+    format_timestamp,
 )
-from exceptions import ValidationException, RateLimitException
+from exceptions import (
+    ValidationException,
+    RateLimitException,
+    TranscriptionException,
+    WebsiteProcessingException,
+)
+import asyncio
+import threading
 import time
+from datetime import datetime
 
 
 class TestURLValidator:
@@ -29,11 +41,14 @@ class TestURLValidator:
         assert not URLValidator.is_valid_url("")
         assert not URLValidator.is_valid_url("not a url")
         assert not URLValidator.is_valid_url(None)
+        assert not URLValidator.is_valid_url("https://exa mple.com")
 
     def test_youtube_url(self):
         """Test YouTube URL detection."""
         assert URLValidator.is_youtube_url("https://www.youtube.com/watch?v=123")
         assert URLValidator.is_youtube_url("https://youtu.be/123")
+        assert URLValidator.is_youtube_url("https://m.youtube.com/watch?v=123")
+        assert not URLValidator.is_youtube_url("https://notyoutube.com/watch?v=123")
         assert not URLValidator.is_youtube_url("https://example.com")
 
     def test_website_url(self):
@@ -48,6 +63,14 @@ class TestURLValidator:
         assert URLValidator.get_url_type("https://example.com") == "website"
         assert URLValidator.get_url_type("invalid") is None
 
+    def test_youtube_video_id(self):
+        """Test YouTube video ID extraction."""
+        assert URLValidator.get_youtube_video_id("https://www.youtube.com/watch?v=abc123&t=5") == "abc123"
+        assert URLValidator.get_youtube_video_id("https://youtu.be/abc123?si=x") == "abc123"
+        assert URLValidator.get_youtube_video_id("https://www.youtube.com/shorts/abc123") == "abc123"
+        assert URLValidator.get_youtube_video_id("https://www.youtube.com/") is None
+        assert URLValidator.get_youtube_video_id("https://example.com/watch?v=abc123") is None
+
 
 class TestAPIKeyValidator:
     """Test API key validation utilities."""
@@ -85,6 +108,17 @@ class TestSimpleCache:
         cache = SimpleCache()
         assert cache.get("nonexistent") is None
 
+    def test_cache_eviction(self):
+        """Test least recently used items are evicted past maxsize."""
+        cache = SimpleCache(maxsize=2)
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.get("key1")
+        cache.set("key3", "value3")
+        assert cache.get("key1") == "value1"
+        assert cache.get("key2") is None
+        assert cache.get_size() == 2
+
     def test_cache_clear(self):
         """Test cache clearing."""
         cache = SimpleCache()
@@ -95,6 +129,45 @@ class TestSimpleCache:
         assert cache.get_size() == 0
 
 
+class TestDiskCache:
+    """Test persistent disk cache."""
+
+    def test_disk_cache_set_and_get(self, tmp_path):
+        """Test values survive a new cache instance."""
+        DiskCache(str(tmp_path)).set("video_base", "transcript")
+        assert DiskCache(str(tmp_path)).get("video_base") == "transcript"
+
+    def test_disk_cache_miss(self, tmp_path):
+        """Test disk cache miss."""
+        assert DiskCache(str(tmp_path / "missing")).get("nonexistent") is None
+
+    def test_disk_cache_clear(self, tmp_path):
+        """Test disk cache clearing."""
+        cache = DiskCache(str(tmp_path))
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        assert cache.get_size() == 2
+        cache.clear()
+        assert cache.get_size() == 0
+
+    def test_disk_cache_size_limit(self, tmp_path):
+        """Test oldest entries are evicted over the size limit."""
+        cache = DiskCache(str(tmp_path), max_bytes=20)
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        assert cache.get_size() == 1
+
+    def test_disk_cache_stays_bounded_across_writes(self, tmp_path):
+        """Test the tracked size keeps the directory under its limit."""
+        cache = DiskCache(str(tmp_path), max_bytes=100)
+        for i in range(20):
+            cache.set(f"key{i}", f"value{i}")
+        files = list(tmp_path.iterdir())
+        assert sum(f.stat().st_size for f in files) <= 100
+        assert all(f.suffix == DiskCache.SUFFIX for f in files)
+        assert cache.get("key19") == "value19"
+
+
 class TestRateLimiter:
     """Test rate limiting utilities."""
 
@@ -120,6 +193,14 @@ class TestRateLimiter:
         time.sleep(1.1)
         assert limiter.is_allowed()
 
+    def test_rate_limit_forgets_idle_identifiers(self):
+        """Test identifiers idle for a full period are dropped."""
+        limiter = RateLimiter(max_calls=1, period_seconds=1)
+        assert limiter.is_allowed("a")
+        time.sleep(1.1)
+        assert limiter.is_allowed("b")
+        assert "a" not in limiter._calls
+
     def test_rate_limit_retry_after(self):
         """Test retry_after calculation."""
         limiter = RateLimiter(max_calls=1, period_seconds=5)
@@ -146,6 +227,19 @@ class TestTextUtilities:
         assert len(sanitized) == 10
         assert sanitized.endswith("...")
 
+    def test_sanitize_text_truncation_matches_full_pass(self):
+        """Test truncating a long text only normalizes what it keeps."""
+        text = "word \n\t  " * 1000
+        expected = " ".join(text.split())[:47] + "..."
+        assert sanitize_text(text, max_length=50) == expected
+        assert sanitize_text("a  b", max_length=50) == "a b"
+
+    def test_count_words(self):
+        """Test word counting across mixed whitespace."""
+        assert count_words("") == 0
+        assert count_words("one two  three") == 3
+        assert count_words("- first point\n- second point\n") == 6
+
     def test_estimate_reading_time(self):
         """Test reading time estimation."""
         # Assuming 200 words per minute
@@ -157,6 +251,201 @@ class TestTextUtilities:
         reading_time = estimate_reading_time(text)
         assert reading_time == 2
 
+    def test_format_timestamp_ns(self):
+        """Test nanosecond timestamps format like datetimes."""
+        dt = datetime(2024, 5, 1, 12, 30, 45)
+        assert format_timestamp(int(dt.timestamp() * 1e9)) == format_timestamp(dt)
+
+    def test_summary_stats(self):
+        """Test word count and reading time in one call."""
+        text = " ".join(["word"] * 400)
+        assert summary_stats(text) == (400, 2)
+        assert summary_stats("") == (0, 1)
+
+
+class TestSummarizationService:
+    """Test map-reduce summarization without calling the LLM."""
+
+    def test_partial_summaries_collapse_until_they_fit(self):
+        """Test joined partial summaries are re-summarized until they fit."""
+        services = pytest.importorskip("services")
+        from langchain_core.documents import Document
+
+        class FakeMessage:
+            content = "word " * 200
+
+        class FakeLLM:
+            rounds = 0
+
+            def batch(self, prompts, config=None):
+                self.rounds += 1
+                return [FakeMessage() for _ in prompts]
+
+        service = services.SummarizationService("test_api_key_123")
+        service._llm = FakeLLM()
+        limit = services.config.MAX_SINGLE_PROMPT_CHARS
+        text = service._prepare_text([Document(page_content="word " * limit)])
+
+        assert service._llm.rounds == 2
+        assert len(text) <= limit
+
+    def test_cached_summary_skips_the_llm(self, monkeypatch):
+        """Test repeated requests, streamed or not, are served from the cache."""
+        services = pytest.importorskip("services")
+        from langchain_core.documents import Document
+
+        class FakeMessage:
+            content = " A short summary. "
+
+        class FakeLLM:
+            calls = 0
+
+            def invoke(self, prompt):
+                self.calls += 1
+                return FakeMessage()
+
+        monkeypatch.setattr(services.config, "ENABLE_CACHE", True)
+        services._summary_cache.clear()
+        service = services.SummarizationService("test_api_key_123")
+        service._llm = FakeLLM()
+        docs = [Document(page_content="Some content worth summarizing.")]
+
+        assert service.summarize(docs) == "A short summary."
+        assert service.summarize(docs) == "A short summary."
+        assert list(service.summarize_stream(docs)) == ["A short summary."]
+        assert service._llm.calls == 1
+
+
+class TestTranscriptionScheduler:
+    """Test GPU transcription scheduling with stubbed download and Whisper."""
+
+    @pytest.fixture
+    def scheduler_module(self, monkeypatch):
+        """Import the scheduler with caching and audio loading stubbed out."""
+        batch_scheduler = pytest.importorskip("batch_scheduler")
+        service = batch_scheduler.YouTubeService
+        monkeypatch.setattr(service, "load_cached_transcript", lambda *args: None)
+        monkeypatch.setattr(service, "save_transcript", lambda *args: None)
+        monkeypatch.setattr(service, "load_audio", lambda url: url)
+        return batch_scheduler
+
+    def test_identical_submits_share_one_job(self, scheduler_module, monkeypatch):
+        """Test duplicate requests in flight transcribe once."""
+        calls = []
+
+        def transcribe(audio, model, language):
+            calls.append(audio)
+            time.sleep(0.05)
+            return f"text of {audio}"
+
+        monkeypatch.setattr(scheduler_module.YouTubeService, "transcribe_audio", transcribe)
+        scheduler = scheduler_module.TranscriptionScheduler(gpu_count=1)
+
+        async def run():
+            return await asyncio.gather(
+                scheduler.submit("video"), scheduler.submit("video")
+            )
+
+        assert asyncio.run(run()) == ["text of video", "text of video"]
+        assert calls == ["video"]
+
+    def test_errors_reach_every_waiter(self, scheduler_module, monkeypatch):
+        """Test a failed transcription raises in all waiting requests."""
+
+        def transcribe(audio, model, language):
+            time.sleep(0.05)
+            raise TranscriptionException("boom")
+
+        monkeypatch.setattr(scheduler_module.YouTubeService, "transcribe_audio", transcribe)
+        scheduler = scheduler_module.TranscriptionScheduler(gpu_count=1)
+
+        async def run():
+            return await asyncio.gather(
+                scheduler.submit("video"),
+                scheduler.submit("video"),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(result, TranscriptionException) for result in results)
+
+    def test_one_transcription_per_gpu(self, scheduler_module, monkeypatch):
+        """Test no more jobs run at once than there are GPU slots."""
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def transcribe(audio, model, language):
+            with lock:
+                running.append(audio)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(audio)
+            return audio
+
+        monkeypatch.setattr(scheduler_module.YouTubeService, "transcribe_audio", transcribe)
+        scheduler = scheduler_module.TranscriptionScheduler(gpu_count=2)
+
+        async def run():
+            return await asyncio.gather(*(scheduler.submit(f"v{i}") for i in range(5)))
+
+        assert asyncio.run(run()) == [f"v{i}" for i in range(5)]
+        assert max(peak) == 2
+
+
+class TestWebsiteService:
+    """Test website decoding and extraction without network access."""
+
+    @pytest.fixture
+    def website_service(self):
+        """Import WebsiteService, skipping when its dependencies are missing."""
+        return pytest.importorskip("services").WebsiteService
+
+    def test_decode_html_uses_header_charset(self, website_service):
+        """Test the Content-Type charset wins over the meta tag."""
+        body = '<meta charset="utf-8"><p>café</p>'.encode("latin-1")
+        assert "café" in website_service._decode_html(body, "latin-1")
+
+    def test_decode_html_uses_meta_charset(self, website_service):
+        """Test the meta charset is used when the header has none."""
+        body = '<meta charset="windows-1252"><p>café</p>'.encode("cp1252")
+        assert "café" in website_service._decode_html(body, None)
+        body = (
+            '<meta http-equiv="Content-Type" content="text/html; charset=iso-8859-1">'
+            "<p>café</p>"
+        ).encode("latin-1")
+        assert "café" in website_service._decode_html(body, None)
+
+    def test_decode_html_falls_back_to_utf8(self, website_service):
+        """Test missing or unknown charsets decode as UTF-8."""
+        body = "<p>café</p>".encode("utf-8")
+        assert website_service._decode_html(body, None) == "<p>café</p>"
+        assert website_service._decode_html(body, "no-such-charset") == "<p>café</p>"
+
+    def test_extract_documents_strips_boilerplate(self, website_service):
+        """Test scripts, styles and page chrome are dropped from the text."""
+        html = (
+            "<html><head><title> Example Page </title><style>p {}</style></head>"
+            "<body><nav>Menu</nav><header>Banner</header>"
+            "<script>var x = 1;</script><p>Article text.</p>"
+            "<footer>Copyright</footer></body></html>"
+        )
+        (doc,) = website_service.extract_documents("https://example.com", html)
+        assert doc.page_content == "Article text."
+        assert doc.metadata == {"source": "https://example.com", "title": "Example Page"}
+
+    def test_extract_documents_without_title(self, website_service):
+        """Test pages without a title only record their source."""
+        (doc,) = website_service.extract_documents("https://example.com", "<p>Text</p>")
+        assert doc.metadata == {"source": "https://example.com"}
+
+    def test_extract_documents_empty_body(self, website_service):
+        """Test pages without readable text raise."""
+        html = "<html><body><script>only()</script><nav>Menu</nav></body></html>"
+        with pytest.raises(WebsiteProcessingException):
+            website_service.extract_documents("https://example.com", html)
+
 
 class TestExceptions:
     """Test custom exception classes."""
@@ -3,14 +3,21 @@ Utility functions for YT Web Summarizer.
 Includes validation, caching, and helper functions.
 """
 
+import os
 import re
+import threading
 import hashlib
 import json
+import tempfile
 import time
+import zlib
+from collections import deque
 from datetime import datetime
-from typing import Optional, Dict, Any, Callable
-from functools import wraps
+from typing import Optional, Deque, Dict, Any, Callable, Tuple, Union
+from functools import lru_cache, wraps
+from urllib.parse import urlsplit, parse_qs
 import validators
+from cachetools import TTLCache
 from logger import setup_logging
 from exceptions import (
     ValidationException,
@@ -23,8 +30,17 @@ logger = setup_logging(__name__)
 class URLValidator:
     """URL validation utilities."""
 
-    YOUTUBE_REGEX = r"(https?://)?(www\.)?(youtube\.com|youtu\.be)/"
+    YOUTUBE_HOSTS = frozenset(
+        {"youtube.com", "www.youtube.com", "m.youtube.com", "youtu.be", "www.youtu.be"}
+    )
     SUPPORTED_DOMAINS = ["youtube.com", "youtu.be", "wikipedia.org", "github.com"]
+    # Plain http(s) URLs with a dotted host and no whitespace or userinfo are
+    # accepted without the full (much slower) validators.url parse
+    SIMPLE_URL_REGEX = re.compile(
+        r"https?://(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z]{2,}(?::\d{1,4})?"
+        r"(?:[/?#][^\s<>\"|^{}\\`]*)?\Z",
+        re.IGNORECASE,
+    )
 
     @staticmethod
     def is_valid_url(url: str) -> bool:
@@ -39,6 +55,8 @@ class URLValidator:
         """
         if not url or not isinstance(url, str):
             return False
+        if URLValidator.SIMPLE_URL_REGEX.match(url):
+            return True
         return validators.url(url) is True
 
     @staticmethod
@@ -54,7 +72,7 @@ class URLValidator:
         """
         if not URLValidator.is_valid_url(url):
             return False
-        return bool(re.match(URLValidator.YOUTUBE_REGEX, url.strip()))
+        return URLValidator._has_youtube_host(url)
 
     @staticmethod
     def is_website_url(url: str) -> bool:
@@ -69,29 +87,64 @@ class URLValidator:
         """
         if not URLValidator.is_valid_url(url):
             return False
-        return not URLValidator.is_youtube_url(url)
+        return not URLValidator._has_youtube_host(url)
+
+    @staticmethod
+    def _has_youtube_host(url: str) -> bool:
+        """Check the host of an already validated URL against YOUTUBE_HOSTS."""
+        return urlsplit(url.strip()).hostname in URLValidator.YOUTUBE_HOSTS
+
+    @staticmethod
+    def get_youtube_video_id(url: str) -> Optional[str]:
+        """
+        Extract the canonical video ID from a YouTube URL.
+
+        Args:
+            url: YouTube URL (watch, youtu.be, shorts, embed or live)
+
+        Returns:
+            Video ID, or None if the URL does not identify a video
+        """
+        if not URLValidator.is_youtube_url(url):
+            return None
+        parts = urlsplit(url.strip())
+        host = parts.netloc.lower()
+        path_segments = [segment for segment in parts.path.split("/") if segment]
+
+        if host.endswith("youtu.be"):
+            return path_segments[0] if path_segments else None
+        if path_segments[:1] == ["watch"]:
+            return parse_qs(parts.query).get("v", [None])[0]
+        if len(path_segments) >= 2 and path_segments[0] in ("shorts", "embed", "live"):
+            return path_segments[1]
+        return None
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def get_url_type(url: str) -> Optional[str]:
         """
         Determine the type of URL.
 
+        Results are memoized because reruns resubmit the same URL.
+
         Args:
             url: URL string to analyze
 
         Returns:
             'youtube', 'website', or None
         """
-        if URLValidator.is_youtube_url(url):
-            return "youtube"
-        elif URLValidator.is_website_url(url):
-            return "website"
-        return None
+        # Validate once, then classify by host
+        if not URLValidator.is_valid_url(url):
+            return None
+        return "youtube" if URLValidator._has_youtube_host(url) else "website"
 
 
 class APIKeyValidator:
     """API key validation utilities."""
 
+    # Groq keys are alphanumeric strings, possibly with '-' or '_'
+    GROQ_KEY_REGEX = re.compile(r"[A-Za-z0-9_\-]{10,}")
+
     @staticmethod
     def validate_groq_key(api_key: str) -> bool:
         """
@@ -105,26 +158,25 @@ class APIKeyValidator:
         """
         if not api_key:
             return False
-        # Groq keys are typically alphanumeric strings
-        return len(api_key) >= 10 and api_key.replace("-", "").replace("_", "").isalnum()
+        return APIKeyValidator.GROQ_KEY_REGEX.fullmatch(api_key) is not None
 
 
 class SimpleCache:
-    """Simple in-memory cache with TTL support."""
+    """Thread-safe in-memory cache with TTL support and a bounded size."""
 
-    def __init__(self, ttl_seconds: int = 3600):
+    def __init__(self, ttl_seconds: int = 3600, maxsize: int = 512):
         """
         Initialize cache.
 
         Args:
             ttl_seconds: Time to live for cached items in seconds
+            maxsize: Maximum number of items; least recently used are evicted
         """
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, Dict[str, Any]] = {}
-
-    def _get_hash(self, key: str) -> str:
-        """Generate hash for cache key."""
-        return hashlib.md5(key.encode()).hexdigest()
+        self.maxsize = maxsize
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        # TTLCache reorders entries on every read, so reads need the lock too
+        self._lock = threading.RLock()
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -134,11 +186,8 @@ class SimpleCache:
             key: Cache key
             value: Value to cache
         """
-        hash_key = self._get_hash(key)
-        self._cache[hash_key] = {
-            "value": value,
-            "timestamp": time.time(),
-        }
+        with self._lock:
+            self._cache[key] = value
         logger.debug(f"Cache set: {key}")
 
     def get(self, key: str) -> Optional[Any]:
@@ -151,27 +200,185 @@ class SimpleCache:
         Returns:
             Cached value if exists and not expired, None otherwise
         """
-        hash_key = self._get_hash(key)
-        if hash_key not in self._cache:
-            return None
+        with self._lock:
+            value = self._cache.get(key)
+        if value is not None:
+            logger.debug(f"Cache hit: {key}")
+        return value
+
+    def clear(self) -> None:
+        """Clear all cache."""
+        with self._lock:
+            self._cache.clear()
+        logger.info("Cache cleared")
+
+    def get_size(self) -> int:
+        """Get cache size in items."""
+        with self._lock:
+            self._cache.expire()
+            return len(self._cache)
+
+
+class DiskCache:
+    """
+    Persistent text cache storing one zlib-compressed file per key.
+
+    Several processes may share the directory, so files are written to a
+    temporary name and renamed into place, and files removed by another
+    process in the meantime are skipped.
+    """
+
+    SUFFIX = ".z"
+    # Eviction trims the cache to this fraction of max_bytes, so the next
+    # sweep is not triggered by the very next write
+    EVICT_TO_FRACTION = 0.9
+
+    def __init__(
+        self,
+        directory: str,
+        ttl_seconds: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        Initialize disk cache.
+
+        Args:
+            directory: Directory holding the cache files
+            ttl_seconds: Time to live for cached items (None never expires)
+            max_bytes: Size limit for the directory; the oldest entries are
+                evicted when it is exceeded (None is unbounded)
+        """
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        # Estimated directory size, so writes only rescan it over the limit
+        self._total_bytes: Optional[int] = None
+        self._size_lock = threading.Lock()
+
+    def _get_path(self, key: str) -> str:
+        """Map cache key to a fixed-length file path."""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.directory, digest + self.SUFFIX)
 
-        cached = self._cache[hash_key]
-        if time.time() - cached["timestamp"] > self.ttl_seconds:
-            del self._cache[hash_key]
-            logger.debug(f"Cache expired: {key}")
+    def set(self, key: str, value: str) -> None:
+        """
+        Store value on disk.
+
+        Args:
+            key: Cache key
+            value: Text to cache
+        """
+        data = zlib.compress(value.encode("utf-8"), 6)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Readers see either the old file or the complete new one
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self._get_path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            logger.debug(f"Disk cache set: {key}")
+            if self.max_bytes is not None:
+                self._track_write(len(data))
+        except OSError as e:
+            logger.warning(f"Disk cache write failed for {key}: {str(e)}")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Retrieve value from disk.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached text if present and not expired, None otherwise
+        """
+        path = self._get_path(key)
+        try:
+            if (
+                self.ttl_seconds is not None
+                and time.time() - os.path.getmtime(path) > self.ttl_seconds
+            ):
+                os.remove(path)
+                logger.debug(f"Disk cache expired: {key}")
+                return None
+            with open(path, "rb") as f:
+                value = zlib.decompress(f.read()).decode("utf-8")
+        except (OSError, zlib.error, UnicodeDecodeError):
             return None
 
-        logger.debug(f"Cache hit: {key}")
-        return cached["value"]
+        logger.debug(f"Disk cache hit: {key}")
+        return value
 
     def clear(self) -> None:
-        """Clear all cache."""
-        self._cache.clear()
-        logger.info("Cache cleared")
+        """Remove all cached files."""
+        for name in self._list_files():
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+        with self._size_lock:
+            self._total_bytes = None
+        logger.info(f"Disk cache cleared: {self.directory}")
 
     def get_size(self) -> int:
         """Get cache size in items."""
-        return len(self._cache)
+        return len(self._list_files())
+
+    def _list_files(self) -> list:
+        """List cache files in the cache directory."""
+        if not os.path.isdir(self.directory):
+            return []
+        return [name for name in os.listdir(self.directory) if name.endswith(self.SUFFIX)]
+
+    def _track_write(self, size: int) -> None:
+        """Add a write to the size estimate and evict once it passes max_bytes."""
+        with self._size_lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan()[1]
+            else:
+                self._total_bytes += size
+            if self._total_bytes > self.max_bytes:
+                self._total_bytes = self._enforce_size_limit()
+
+    def _scan(self) -> Tuple[list, int]:
+        """Return (mtime, size, name) for every cache file and their total size."""
+        entries = []
+        total = 0
+        for name in self._list_files():
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+            total += stat.st_size
+        return entries, total
+
+    def _enforce_size_limit(self) -> int:
+        """
+        Evict the oldest files until the cache is back under its limit.
+
+        Returns:
+            Size of the cache directory after eviction
+        """
+        entries, total = self._scan()
+        if total <= self.max_bytes:
+            return total
+
+        target = self.max_bytes * self.EVICT_TO_FRACTION
+        for _, size, name in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+            logger.debug(f"Disk cache evicted: {name}")
+        return total
 
 
 class RateLimiter:
@@ -187,7 +394,9 @@ class RateLimiter:
         """
         self.max_calls = max_calls
         self.period_seconds = period_seconds
-        self._calls: Dict[str, list] = {}
+        # The last max_calls timestamps per identifier; the oldest one decides
+        self._calls: Dict[str, Deque[float]] = {}
+        self._next_sweep = time.monotonic() + period_seconds
 
     def is_allowed(self, identifier: str = "default") -> bool:
         """
@@ -199,31 +408,37 @@ class RateLimiter:
         Returns:
             True if allowed, False if rate limited
         """
-        now = time.time()
-        if identifier not in self._calls:
-            self._calls[identifier] = []
-
-        # Remove old calls outside the period
-        self._calls[identifier] = [
-            call_time
-            for call_time in self._calls[identifier]
-            if now - call_time < self.period_seconds
-        ]
-
-        if len(self._calls[identifier]) < self.max_calls:
-            self._calls[identifier].append(now)
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._sweep(now)
+
+        calls = self._calls.get(identifier)
+        if calls is None:
+            calls = self._calls[identifier] = deque(maxlen=self.max_calls)
+
+        if len(calls) < self.max_calls or now - calls[0] >= self.period_seconds:
+            calls.append(now)
             return True
 
         return False
 
     def get_retry_after(self, identifier: str = "default") -> int:
         """Get seconds to wait before next call is allowed."""
-        if identifier not in self._calls or not self._calls[identifier]:
+        calls = self._calls.get(identifier)
+        if not calls or len(calls) < self.max_calls:
             return 0
-        oldest_call = min(self._calls[identifier])
-        retry_after = int(self.period_seconds - (time.time() - oldest_call)) + 1
+        retry_after = int(self.period_seconds - (time.monotonic() - calls[0])) + 1
         return max(0, retry_after)
 
+    def _sweep(self, now: float) -> None:
+        """Forget identifiers with no calls in the current window."""
+        self._calls = {
+            identifier: calls
+            for identifier, calls in self._calls.items()
+            if calls and now - calls[-1] < self.period_seconds
+        }
+        self._next_sweep = now + self.period_seconds
+
 
 def rate_limit(max_calls: int, period_seconds: int):
     """
@@ -262,7 +477,14 @@ def sanitize_text(text: str, max_length: Optional[int] = None) -> str:
     Returns:
         Sanitized text
     """
-    # Remove extra whitespace
+    if max_length:
+        # Only the head of a long text can survive truncation, so normalize
+        # that first; whitespace collapsing never lengthens a prefix
+        head = " ".join(text[: 2 * max_length].split())
+        if len(head) > max_length:
+            return head[: max_length - 3] + "..."
+
+    # Remove extra whitespace (split/join runs in C and beats re.sub)
     text = " ".join(text.split())
 
     # Truncate if needed
@@ -272,21 +494,39 @@ def sanitize_text(text: str, max_length: Optional[int] = None) -> str:
     return text
 
 
-def format_timestamp(dt: Optional[datetime] = None) -> str:
+def format_timestamp(dt: Optional[Union[datetime, int]] = None) -> str:
     """
     Format datetime to string.
 
     Args:
-        dt: Datetime object (defaults to now)
+        dt: Datetime object, or nanoseconds since the epoch as returned by
+            time.time_ns() (defaults to now)
 
     Returns:
         Formatted datetime string
     """
     if dt is None:
         dt = datetime.now()
+    elif isinstance(dt, int):
+        dt = datetime.fromtimestamp(dt / 1e9)
     return dt.strftime("%Y-%m-%d %H:%M:%S")
 
 
+def count_words(text: str) -> int:
+    """
+    Count whitespace-separated words.
+
+    Args:
+        text: Text to count
+
+    Returns:
+        Number of words
+    """
+    # str.split() runs in C and handles newlines and repeated spaces; regex
+    # scans are several times slower and counting spaces miscounts lists.
+    return len(text.split()) if text else 0
+
+
 def estimate_reading_time(text: str, words_per_minute: int = 200) -> int:
     """
     Estimate reading time in minutes.
@@ -298,5 +538,22 @@ def estimate_reading_time(text: str, words_per_minute: int = 200) -> int:
     Returns:
         Estimated minutes to read
     """
-    word_count = len(text.split())
-    return max(1, word_count // words_per_minute)
+    return max(1, count_words(text) // words_per_minute)
+
+
+@lru_cache(maxsize=128)
+def summary_stats(text: str, words_per_minute: int = 200) -> Tuple[int, int]:
+    """
+    Compute word count and reading time with a single tokenization.
+
+    Results are cached, so reruns that redisplay the same summary are free.
+
+    Args:
+        text: Text to measure
+        words_per_minute: Reading speed assumption
+
+    Returns:
+        Tuple of (word_count, reading_time_minutes)
+    """
+    word_count = count_words(text)
+    return word_count, max(1, word_count // words_per_minute)